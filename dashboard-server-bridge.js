@@ -12,6 +12,7 @@ import crypto from 'crypto';
 import { spawn } from 'child_process';
 import { MemoryFormat } from './lib/memory-format.js';
 import { TaskStorage } from './lib/task-storage.js';
+import { TaskFormat } from './lib/task-format.js';
 import { MemoryStorageWrapper } from './lib/memory-storage-wrapper.js';
 import { UnifiedMemoryStorage, UnifiedTaskStorage } from './lib/unified-storage-adapter.js';
 import { SystemSafeguards } from './lib/system-safeguards.js';
@@ -30,6 +31,8 @@ import yaml from 'js-yaml';
 import { startServerWithValidation, cleanupPortFile } from './lib/robust-port-finder.js';
 import { PathSettings } from './lib/path-settings.js';
 import { FolderDiscovery } from './lib/folder-discovery.js';
+import { isDirectoryEntry } from './lib/fs-utils.js';
+import { escapeRegExp } from './lib/regex-utils.js';
 import { ReflectionEngine } from './lib/reflection-engine.js';
 import { PatternLearner } from './lib/pattern-learner.js';
 import { readFileSync } from 'fs';
@@ -51,6 +54,9 @@ class DashboardBridge {
     const paths = this.pathSettings.getEffectivePaths();
     this.memoriesDir = paths.memories;
     this.tasksDir = paths.tasks;
+    this.memoryLocations = new Map(); // memory id -> { filePath, project }, filled by findMemoryById, in LRU order
+    this.parsedMemoryCache = new Map(); // filePath -> { mtimeMs, size, memory }, in LRU order
+    this.maxParsedMemoryCacheSize = 2000; // also caps memoryLocations
     
     this.memoryStorage = new UnifiedMemoryStorage(this.memoriesDir);
     this.taskStorage = new UnifiedTaskStorage(this.tasksDir);
@@ -591,6 +597,7 @@ class DashboardBridge {
       })
       .on('unlink', (filePath) => {
         console.log('🗑️ Memory file deleted:', path.basename(filePath));
+        this.forgetMemoryFile(filePath);
         this.broadcastChange('delete', filePath);
       });
 
@@ -650,12 +657,11 @@ class DashboardBridge {
     let count = 0;
     try {
       await fsPromises.access(this.memoriesDir);
-      const projects = await fsPromises.readdir(this.memoriesDir);
+      const projects = await fsPromises.readdir(this.memoriesDir, { withFileTypes: true });
       for (const project of projects) {
-        const projectPath = path.join(this.memoriesDir, project);
+        const projectPath = path.join(this.memoriesDir, project.name);
         try {
-          const stat = await fsPromises.stat(projectPath);
-          if (stat.isDirectory()) {
+          if (isDirectoryEntry(project, this.memoriesDir)) {
             const files = await fsPromises.readdir(projectPath);
             count += files.filter(f => f.endsWith('.md')).length;
           }
@@ -670,8 +676,34 @@ class DashboardBridge {
   }
 
   parseMarkdownFile(filePath) {
+    let stat;
+    try {
+      stat = fs.statSync(filePath);
+    } catch {
+      // Let the shared parser report the missing/unreadable file
+      return MemoryFormat.parseMemoryFile(filePath);
+    }
+
+    // Unchanged files (same mtime and size) are served from the cache.
+    // Callers mutate what they get back, so hand out copies.
+    const cached = this.parsedMemoryCache.get(filePath);
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      // Refresh recency so the Map's insertion order acts as an LRU
+      this.parsedMemoryCache.delete(filePath);
+      this.parsedMemoryCache.set(filePath, cached);
+      return structuredClone(cached.memory);
+    }
+
     // Use the shared memory format parser
-    return MemoryFormat.parseMemoryFile(filePath);
+    const memory = MemoryFormat.parseMemoryFile(filePath);
+    this.parsedMemoryCache.delete(filePath);
+    if (memory) {
+      this.parsedMemoryCache.set(filePath, { mtimeMs: stat.mtimeMs, size: stat.size, memory: structuredClone(memory) });
+      if (this.parsedMemoryCache.size > this.maxParsedMemoryCacheSize) {
+        this.parsedMemoryCache.delete(this.parsedMemoryCache.keys().next().value);
+      }
+    }
+    return memory;
   }
 
   // Authentication route handlers
@@ -880,65 +912,14 @@ class DashboardBridge {
         });
       }
 
-      const allItems = await fsPromises.readdir(this.memoriesDir);
-      const projects = [];
-      
-      // Filter directories asynchronously
-      for (const item of allItems) {
-        try {
-          const dirPath = path.join(this.memoriesDir, item);
-          const stat = await fsPromises.stat(dirPath);
-          if (stat.isDirectory()) {
-            projects.push(item);
-          }
-        } catch {
-          // Skip if can't access
+      for (const entry of await this.listMemoryFiles(project)) {
+        const memory = this.parseMarkdownFile(entry.filePath);
+        if (memory) {
+          memory.project = entry.project;
+          memories.push(memory);
         }
       }
 
-      for (const proj of projects) {
-        if (project && proj !== project) continue;
-        
-        const projectPath = path.join(this.memoriesDir, proj);
-        
-        // Recursive async function to find all .md files in nested directories
-        const findMemoryFiles = async (dir, currentProject = proj) => {
-          try {
-            const items = await fsPromises.readdir(dir);
-            
-            for (const item of items) {
-              const itemPath = path.join(dir, item);
-              try {
-                const stat = await fsPromises.stat(itemPath);
-                
-                if (stat.isDirectory()) {
-                  // For nested directories, use the subdirectory name as the project
-                  const nestedProject = dir === projectPath ? item : currentProject;
-                  await findMemoryFiles(itemPath, nestedProject);
-                } else if (item.endsWith('.md')) {
-                  const memory = this.parseMarkdownFile(itemPath);
-                  if (memory) {
-                    // Use the nested directory structure to determine project
-                    if (proj === 'default' && currentProject !== 'default') {
-                      memory.project = currentProject;
-                    } else {
-                      memory.project = proj === 'default' ? undefined : proj;
-                    }
-                    memories.push(memory);
-                  }
-                }
-              } catch {
-                // Skip if can't access item
-              }
-            }
-          } catch {
-            // Skip if can't read directory
-          }
-        };
-        
-        await findMemoryFiles(projectPath);
-      }
-
       // Remove duplicates based on memory ID
       const uniqueMemories = [];
       const seenIds = new Set();
@@ -954,10 +935,11 @@ class DashboardBridge {
       let filteredMemories = uniqueMemories;
       
       if (filter_search) {
-        const searchTerm = filter_search.toLowerCase();
+        // One case-insensitive pattern instead of lowercasing every field per memory
+        const searchPattern = new RegExp(escapeRegExp(filter_search), 'i');
         filteredMemories = filteredMemories.filter(memory => 
-          memory.content?.toLowerCase().includes(searchTerm) ||
-          memory.tags?.some(tag => tag.toLowerCase().includes(searchTerm))
+          (memory.content && searchPattern.test(memory.content)) ||
+          memory.tags?.some(tag => searchPattern.test(tag))
         );
       }
       
@@ -1051,8 +1033,7 @@ class DashboardBridge {
   async getMemory(req, res) {
     try {
       const { id } = req.params;
-      const memories = await this.getAllMemories();
-      const memory = memories.find(m => m.id === id);
+      const memory = await this.findMemoryById(id);
       
       if (!memory) {
         return res.status(404).json({ error: 'Memory not found' });
@@ -1065,25 +1046,28 @@ class DashboardBridge {
     }
   }
 
-  async getAllMemories() {
-    const memories = [];
+  /**
+   * Walk the memories directory and list every memory file together with the
+   * project it belongs to (nested directories under default/ act as projects).
+   * Pass onlyProject to restrict the walk to one top-level project directory.
+   */
+  async listMemoryFiles(onlyProject) {
+    const entries = [];
     
     try {
       await fsPromises.access(this.memoriesDir);
     } catch {
-      return memories;
+      return entries;
     }
 
-    const allItems = await fsPromises.readdir(this.memoriesDir);
+    const allItems = await fsPromises.readdir(this.memoriesDir, { withFileTypes: true });
     const projects = [];
     
-    // Filter directories asynchronously
+    // Filter directories using the dirent type (symlinks still need a stat)
     for (const item of allItems) {
       try {
-        const dirPath = path.join(this.memoriesDir, item);
-        const stat = await fsPromises.stat(dirPath);
-        if (stat.isDirectory()) {
-          projects.push(item);
+        if (isDirectoryEntry(item, this.memoriesDir)) {
+          projects.push(item.name);
         }
       } catch {
         // Skip if can't access
@@ -1091,33 +1075,29 @@ class DashboardBridge {
     }
 
     for (const proj of projects) {
+      if (onlyProject && proj !== onlyProject) continue;
+      
       const projectPath = path.join(this.memoriesDir, proj);
       
       // Recursive async function to find all .md files in nested directories
       const findMemoryFiles = async (dir, currentProject = proj) => {
         try {
-          const items = await fsPromises.readdir(dir);
+          const items = await fsPromises.readdir(dir, { withFileTypes: true });
           
-          for (const item of items) {
+          for (const entry of items) {
+            const item = entry.name;
             const itemPath = path.join(dir, item);
             try {
-              const stat = await fsPromises.stat(itemPath);
-              
-              if (stat.isDirectory()) {
+              if (isDirectoryEntry(entry, dir)) {
                 // For nested directories, use the subdirectory name as the project
                 const nestedProject = dir === projectPath ? item : currentProject;
                 await findMemoryFiles(itemPath, nestedProject);
               } else if (item.endsWith('.md')) {
-                const memory = this.parseMarkdownFile(itemPath);
-                if (memory) {
-                  // Use the nested directory structure to determine project
-                  if (proj === 'default' && currentProject !== 'default') {
-                    memory.project = currentProject;
-                  } else {
-                    memory.project = proj === 'default' ? undefined : proj;
-                  }
-                  memories.push(memory);
-                }
+                // Use the nested directory structure to determine project
+                const project = proj === 'default' && currentProject !== 'default'
+                  ? currentProject
+                  : (proj === 'default' ? undefined : proj);
+                entries.push({ filePath: itemPath, project });
               }
             } catch {
               // Skip if can't access item
@@ -1130,6 +1110,20 @@ class DashboardBridge {
       
       await findMemoryFiles(projectPath);
     }
+
+    return entries;
+  }
+
+  async getAllMemories() {
+    const memories = [];
+
+    for (const { filePath, project } of await this.listMemoryFiles()) {
+      const memory = this.parseMarkdownFile(filePath);
+      if (memory) {
+        memory.project = project;
+        memories.push(memory);
+      }
+    }
     
     // Remove duplicates based on memory ID
     const uniqueMemories = [];
@@ -1145,6 +1139,87 @@ class DashboardBridge {
     return uniqueMemories;
   }
 
+  /**
+   * Find a single memory by id. A previously seen id goes straight to its
+   * remembered file; otherwise only frontmatter headers are read while
+   * searching, and every header seen is remembered for later lookups.
+   */
+  async findMemoryById(id) {
+    const known = this.memoryLocations.get(id);
+    if (known) {
+      const memory = fs.existsSync(known.filePath) ? this.parseMarkdownFile(known.filePath) : null;
+      if (memory && memory.id === id) {
+        // Refresh recency so the Map's insertion order acts as an LRU
+        this.memoryLocations.delete(id);
+        this.memoryLocations.set(id, known);
+        memory.project = known.project;
+        return memory;
+      }
+      // Moved, renamed or deleted - rescan below
+      this.memoryLocations.delete(id);
+    }
+
+    for (const { filePath, project } of await this.listMemoryFiles()) {
+      // Files without frontmatter (HTML-comment format) get a full parse
+      const header = await MemoryFormat.parseMemoryHeaderAsync(filePath);
+      if (header) this.rememberMemoryLocation(header.id, filePath, project);
+      if (header && header.id !== id) continue;
+
+      const memory = this.parseMarkdownFile(filePath);
+      if (memory && memory.id === id) {
+        memory.project = project;
+        return memory;
+      }
+    }
+    return undefined;
+  }
+
+  /**
+   * Record where a memory id lives, keeping the first location seen and
+   * evicting the least recently used entry past the cache size limit
+   */
+  rememberMemoryLocation(id, filePath, project) {
+    if (this.memoryLocations.has(id)) return;
+    this.memoryLocations.set(id, { filePath, project });
+    if (this.memoryLocations.size > this.maxParsedMemoryCacheSize) {
+      this.memoryLocations.delete(this.memoryLocations.keys().next().value);
+    }
+  }
+
+  /**
+   * Drop everything cached about a memory file that was deleted or moved
+   */
+  forgetMemoryFile(filePath) {
+    this.parsedMemoryCache.delete(filePath);
+    for (const [id, location] of this.memoryLocations) {
+      if (location.filePath === filePath) this.memoryLocations.delete(id);
+    }
+  }
+
+  /**
+   * Find several memories in one header-only pass over the memory files.
+   * Returns a Map of id -> memory for the ids that exist.
+   */
+  async findMemoriesByIds(ids) {
+    const wanted = new Set(ids);
+    const found = new Map();
+
+    for (const { filePath, project } of await this.listMemoryFiles()) {
+      if (found.size === wanted.size) break;
+
+      const header = await MemoryFormat.parseMemoryHeaderAsync(filePath);
+      if (header) this.rememberMemoryLocation(header.id, filePath, project);
+      if (header && (!wanted.has(header.id) || found.has(header.id))) continue;
+
+      const memory = this.parseMarkdownFile(filePath);
+      if (memory && wanted.has(memory.id) && !found.has(memory.id)) {
+        memory.project = project;
+        found.set(memory.id, memory);
+      }
+    }
+    return found;
+  }
+
   async createMemory(req, res) {
     try {
       const { content, tags = [], category, project } = req.body;
@@ -1157,15 +1232,18 @@ class DashboardBridge {
       const timestamp = Date.now();
       const randomStr = Math.random().toString(36).substring(2, 15);
       const id = `${timestamp}${randomStr}`;
+      // One clock read for the id, filename date, timestamp and last_accessed
+      const now = new Date(timestamp).toISOString();
+      const trimmedContent = content.trim();
       
       // Create filename
-      const titleSlug = content.trim()
+      const titleSlug = trimmedContent
         .toLowerCase()
         .replace(/[^a-z0-9\s-]/g, '')
         .replace(/\s+/g, '-')
         .substring(0, 40);
       const shortId = timestamp.toString().slice(-6);
-      const filename = `${new Date().toISOString().split('T')[0]}-${titleSlug}-${shortId}.md`;
+      const filename = `${now.slice(0, 10)}-${titleSlug}-${shortId}.md`;
       
       // Determine project directory
       const projectDir = project || 'default';
@@ -1181,8 +1259,8 @@ class DashboardBridge {
       // Create memory object
       const memory = {
         id,
-        content: content.trim(),
-        timestamp: new Date().toISOString(),
+        content: trimmedContent,
+        timestamp: now,
         complexity: 1,
         category: category || undefined,
         project: project && project !== 'default' ? project : undefined,
@@ -1190,7 +1268,7 @@ class DashboardBridge {
         priority: 'medium',
         status: 'active',
         access_count: 0,
-        last_accessed: new Date().toISOString(),
+        last_accessed: now,
         metadata: {
           content_type: 'text',
           size: content.length,
@@ -1225,8 +1303,7 @@ class DashboardBridge {
       }
       
       // Find the memory file
-      const memories = await this.getAllMemories();
-      const memory = memories.find(m => m.id === id);
+      const memory = await this.findMemoryById(id);
       
       if (!memory) {
         return res.status(404).json({ error: 'Memory not found' });
@@ -1236,7 +1313,7 @@ class DashboardBridge {
       memory.content = content.trim();
       memory.tags = tags || [];
       memory.timestamp = new Date().toISOString();
-      memory.last_accessed = new Date().toISOString();
+      memory.last_accessed = memory.timestamp;
       memory.metadata.size = content.length;
       
       // Generate standardized markdown content
@@ -1258,8 +1335,7 @@ class DashboardBridge {
   async deleteMemory(req, res) {
     try {
       const { id } = req.params;
-      const memories = await this.getAllMemories();
-      const memory = memories.find(m => m.id === id);
+      const memory = await this.findMemoryById(id);
       
       if (!memory) {
         return res.status(404).json({ error: 'Memory not found' });
@@ -1267,6 +1343,7 @@ class DashboardBridge {
       
       // Delete the markdown file
       fs.unlinkSync(memory.filepath);
+      this.forgetMemoryFile(memory.filepath);
       
       res.json({ success: true, message: 'Memory deleted successfully' });
     } catch (error) {
@@ -1360,20 +1437,17 @@ class DashboardBridge {
       
       try {
         await fsPromises.access(this.memoriesDir);
-        const allItems = await fsPromises.readdir(this.memoriesDir);
+        const allItems = await fsPromises.readdir(this.memoriesDir, { withFileTypes: true });
         
         for (const item of allItems) {
           try {
-            const dirPath = path.join(this.memoriesDir, item);
-            const stat = await fsPromises.stat(dirPath);
-            
-            if (stat.isDirectory()) {
-              const files = await fsPromises.readdir(dirPath);
+            if (isDirectoryEntry(item, this.memoriesDir)) {
+              const files = await fsPromises.readdir(path.join(this.memoriesDir, item.name));
               const mdFiles = files.filter(f => f.endsWith('.md'));
               
               projects.push({
-                name: item === 'default' ? 'Default' : item,
-                id: item,
+                name: item.name === 'default' ? 'Default' : item.name,
+                id: item.name,
                 count: mdFiles.length
               });
             }
@@ -1481,6 +1555,8 @@ class DashboardBridge {
       // Update runtime paths
       this.memoriesDir = updateResult.memories.path;
       this.tasksDir = updateResult.tasks.path;
+      this.memoryLocations.clear();
+      this.parsedMemoryCache.clear();
       
       // Update storage instances
       this.memoryStorage = new UnifiedMemoryStorage(this.memoriesDir);
@@ -1724,6 +1800,9 @@ class DashboardBridge {
           let jsonResponse = null;
           
           for (const line of lines) {
+            // JSON-RPC responses are objects - skip log lines without paying
+            // for sanitizing and a throwing JSON.parse on each of them
+            if (line.trimStart()[0] !== '{') continue;
             try {
               // Sanitize the line before parsing to handle invalid Unicode
               const sanitizedLine = this.sanitizeUnicode(line);
@@ -1869,7 +1948,8 @@ class DashboardBridge {
       const content = fs.readFileSync(filePath, 'utf8');
       
       // Try standard frontmatter format first
-      let frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---\n([\s\S]*)$/);
+      const sections = MemoryFormat.splitFrontmatter(content);
+      let frontmatterMatch = sections && [content, sections.frontmatter, sections.body];
       
       // If that fails, try the malformed format where --- is attached to content
       if (!frontmatterMatch) {
@@ -1882,7 +1962,7 @@ class DashboardBridge {
       const description = frontmatterMatch[2].trim();
       
       // Parse YAML frontmatter
-      const frontmatter = yaml.load(frontmatterText);
+      const frontmatter = TaskFormat.parseFlatYaml(frontmatterText) ?? yaml.load(frontmatterText, TaskFormat.YAML_LOAD_OPTIONS);
       
       return {
         ...frontmatter,
@@ -2150,10 +2230,13 @@ class DashboardBridge {
       
       // Get connected memories
       if (task.memory_connections && task.memory_connections.length > 0) {
-        const allMemories = await this.getAllMemories();
+        // Only the connected memories are fully parsed
+        const connected = await this.findMemoriesByIds(
+          task.memory_connections.map(connection => connection.memory_id)
+        );
         
         for (const connection of task.memory_connections) {
-          const memory = allMemories.find(m => m.id === connection.memory_id);
+          const memory = connected.get(connection.memory_id);
           if (memory) {
             memories.push({
               ...memory,
@@ -4225,6 +4308,7 @@ ${diagnostics.recommendations.map(r => `   • ${r}`).join('\n')}
             const filepath = path.join(projectDir, filename);
             if (fs.existsSync(filepath)) {
               fs.unlinkSync(filepath);
+              this.forgetMemoryFile(filepath);
             }
           }
           result = {
@@ -4239,11 +4323,12 @@ ${diagnostics.recommendations.map(r => `   • ${r}`).join('\n')}
         case 'search_memories': {
           // Search memories using the memory storage wrapper
           const memories = await this.memoryStorage.listMemories();
-          const query = args.query.toLowerCase();
+          // One case-insensitive pattern instead of lowercasing every memory's content
+          const searchPattern = new RegExp(escapeRegExp(args.query), 'i');
           const results = memories.filter(m => {
             if (args.project && m.project !== args.project) return false;
-            return m.content.toLowerCase().includes(query) ||
-                   (m.tags && m.tags.some(t => t.toLowerCase().includes(query)));
+            return (m.content && searchPattern.test(m.content)) ||
+                   (m.tags && m.tags.some(t => searchPattern.test(t)));
           });
           result = {
             content: [{
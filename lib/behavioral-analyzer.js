@@ -6,12 +6,23 @@
 import fs from 'fs';
 import path from 'path';
 
+// Analyzers with a deferred pattern save; one exit hook flushes them all
+const pendingAnalyzers = new Set();
+process.once('exit', () => {
+  for (const analyzer of pendingAnalyzers) analyzer.flushPatterns();
+});
+
 export class BehavioralAnalyzer {
   constructor(dataPath = 'data') {
     this.dataPath = dataPath;
     this.behaviorFile = path.join(dataPath, 'behavior-patterns.json');
     this.patterns = this.loadPatterns();
     
+    // Per-event tracking only marks patterns dirty; the JSON file is
+    // rewritten at most once per saveDelay instead of on every read/search
+    this.saveDelay = 5000;
+    this.saveTimer = null;
+    
     // Thresholds for automatic actions
     this.thresholds = {
       searchRepetition: 3,        // Create memory after 3 failed searches
@@ -72,6 +83,27 @@ export class BehavioralAnalyzer {
     }
   }
   
+  /**
+   * Schedule a deferred save of behavior patterns
+   */
+  schedulePatternSave() {
+    if (this.saveTimer) return;
+    this.saveTimer = setTimeout(() => this.flushPatterns(), this.saveDelay);
+    this.saveTimer.unref?.();
+    pendingAnalyzers.add(this);
+  }
+  
+  /**
+   * Write any pending pattern changes to disk
+   */
+  flushPatterns() {
+    if (!this.saveTimer) return;
+    clearTimeout(this.saveTimer);
+    this.saveTimer = null;
+    pendingAnalyzers.delete(this);
+    this.savePatterns();
+  }
+  
   /**
    * Track a search query and its results
    */
@@ -105,7 +137,7 @@ export class BehavioralAnalyzer {
       }
     }
     
-    this.savePatterns();
+    this.schedulePatternSave();
     return null;
   }
   
@@ -144,7 +176,7 @@ export class BehavioralAnalyzer {
       };
     }
     
-    this.savePatterns();
+    this.schedulePatternSave();
     return null;
   }
   
@@ -198,7 +230,7 @@ export class BehavioralAnalyzer {
     this.patterns.errorPatterns[errorKey] = this.patterns.errorPatterns[errorKey] || { count: 0, resolutions: [] };
     this.patterns.errorPatterns[errorKey].count++;
     
-    this.savePatterns();
+    this.schedulePatternSave();
     return null;
   }
   
@@ -247,7 +279,7 @@ export class BehavioralAnalyzer {
       };
     }
     
-    this.savePatterns();
+    this.schedulePatternSave();
     return null;
   }
   
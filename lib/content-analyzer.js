@@ -3,6 +3,17 @@
  * Analyzes text content to suggest appropriate categories based on keywords, patterns, and existing data
  */
 
+// Indicator checks are compiled once at module load, each group folded into a
+// single alternation so a check is one scan of the content instead of one per
+// pattern. They are shared objects used with .test(), so they must not carry
+// the /g flag (lastIndex would leak between calls).
+const CODE_INDICATOR_REGEX = /```[\s\S]*?```|\b(?:function|class|const|let|var|if|else|for|while|return)\s*[\(\{]|[{}();]|\b\w+\.\w+\(|\/\/.*$|\/\*[\s\S]*?\*\//m;
+const TECH_DOC_REGEX = /\b(?:API|SDK|CLI|GUI|URL|HTTP|JSON|XML|SQL)\b|\b(?:install|configure|setup|deploy|build|run)\b|\b(?:version|v\d+\.\d+|\d+\.\d+\.\d+)\b|\b(?:documentation|docs|readme|guide|tutorial)\b/i;
+const MEETING_REGEX = /\b(?:meeting|call|standup|retrospective|planning)\b|\b(?:agenda|action items?|follow[- ]?up|next steps?)\b|\b(?:attendees?|participants?|stakeholders?)\b|\b\d{1,2}:\d{2}\s*(?:AM|PM)\b/i;
+const RESEARCH_REGEX = /\b(?:hypothesis|methodology|analysis|findings|conclusions?)\b|\b(?:study|research|investigation|survey|experiment)\b|\b(?:data|statistics|metrics|results|insights?)\b|\b\d+%|\bp\s*[<>=]\s*0\.\d+/i;
+const PERSONAL_REGEX = /\b(?:I|my|me|myself|personally)\b|\b(?:family|friend|hobby|interest|goal|plan)\b|\b(?:weekend|vacation|birthday|anniversary)\b/i;
+const PREFERENCE_REGEX = /\b(?:prefer|like|dislike|favorite|choice)\b|\b(?:setting|config|configuration|default|custom)\b|\b(?:always|never|usually|typically)\b|\b(?:theme|color|font|layout|style)\b/i;
+
 class ContentAnalyzer {
   constructor() {
     this.categoryPatterns = {
@@ -122,6 +133,12 @@ class ContentAnalyzer {
       personal: 'Individual activities, hobbies, personal goals, and private matters',
       preferences: 'User settings, choices, customizations, and personal workflows'
     };
+
+    // Memoized results: identical content is analyzed once until the keyword
+    // set changes (see learnFromExistingData)
+    this.suggestionCache = new Map();
+    this.maxCacheSize = 256;
+    this.termRegexCache = new Map();
   }
 
   /**
@@ -136,6 +153,16 @@ class ContentAnalyzer {
     }
 
     const { maxSuggestions = 3, minConfidence = 0.1 } = options;
+
+    const cacheKey = `${maxSuggestions}|${minConfidence}|${content}`;
+    const cached = this.suggestionCache.get(cacheKey);
+    if (cached) {
+      // Refresh recency so the Map's insertion order acts as an LRU
+      this.suggestionCache.delete(cacheKey);
+      this.suggestionCache.set(cacheKey, cached);
+      return cached.map(suggestion => ({ ...suggestion }));
+    }
+
     const scores = {};
 
     // Initialize scores
@@ -181,7 +208,12 @@ class ContentAnalyzer {
       .sort((a, b) => b.confidence - a.confidence)
       .slice(0, maxSuggestions);
 
-    return suggestions;
+    this.suggestionCache.set(cacheKey, suggestions);
+    if (this.suggestionCache.size > this.maxCacheSize) {
+      this.suggestionCache.delete(this.suggestionCache.keys().next().value);
+    }
+
+    return suggestions.map(suggestion => ({ ...suggestion }));
   }
 
   /**
@@ -237,85 +269,42 @@ class ContentAnalyzer {
    * Detect code characteristics
    */
   hasCodeCharacteristics(content) {
-    const codeIndicators = [
-      /```[\s\S]*?```/g, // Code blocks
-      /\b(function|class|const|let|var|if|else|for|while|return)\s*[\(\{]/g,
-      /[{}();]/g, // Code punctuation
-      /\b\w+\.\w+\(/g, // Method calls
-      /\/\/.*$/gm, // Comments
-      /\/\*[\s\S]*?\*\//g // Block comments
-    ];
-
-    return codeIndicators.some(pattern => pattern.test(content));
+    return CODE_INDICATOR_REGEX.test(content);
   }
 
   /**
    * Detect technical documentation patterns
    */
   hasTechnicalDocumentationPatterns(content) {
-    const techDocPatterns = [
-      /\b(API|SDK|CLI|GUI|URL|HTTP|JSON|XML|SQL)\b/gi,
-      /\b(install|configure|setup|deploy|build|run)\b/gi,
-      /\b(version|v\d+\.\d+|\d+\.\d+\.\d+)\b/gi,
-      /\b(documentation|docs|readme|guide|tutorial)\b/gi
-    ];
-
-    return techDocPatterns.some(pattern => pattern.test(content));
+    return TECH_DOC_REGEX.test(content);
   }
 
   /**
    * Detect meeting/work patterns
    */
   hasMeetingPatterns(content) {
-    const meetingPatterns = [
-      /\b(meeting|call|standup|retrospective|planning)\b/gi,
-      /\b(agenda|action items?|follow[- ]?up|next steps?)\b/gi,
-      /\b(attendees?|participants?|stakeholders?)\b/gi,
-      /\b\d{1,2}:\d{2}\s*(AM|PM)\b/gi // Time mentions
-    ];
-
-    return meetingPatterns.some(pattern => pattern.test(content));
+    return MEETING_REGEX.test(content);
   }
 
   /**
    * Detect research patterns
    */
   hasResearchPatterns(content) {
-    const researchPatterns = [
-      /\b(hypothesis|methodology|analysis|findings|conclusions?)\b/gi,
-      /\b(study|research|investigation|survey|experiment)\b/gi,
-      /\b(data|statistics|metrics|results|insights?)\b/gi,
-      /\b\d+%|\bp\s*[<>=]\s*0\.\d+/gi // Statistics
-    ];
-
-    return researchPatterns.some(pattern => pattern.test(content));
+    return RESEARCH_REGEX.test(content);
   }
 
   /**
    * Detect personal indicators
    */
   hasPersonalIndicators(content) {
-    const personalPatterns = [
-      /\b(I|my|me|myself|personally)\b/gi,
-      /\b(family|friend|hobby|interest|goal|plan)\b/gi,
-      /\b(weekend|vacation|birthday|anniversary)\b/gi
-    ];
-
-    return personalPatterns.some(pattern => pattern.test(content));
+    return PERSONAL_REGEX.test(content);
   }
 
   /**
    * Detect preference indicators
    */
   hasPreferenceIndicators(content) {
-    const preferencePatterns = [
-      /\b(prefer|like|dislike|favorite|choice)\b/gi,
-      /\b(setting|config|configuration|default|custom)\b/gi,
-      /\b(always|never|usually|typically)\b/gi,
-      /\b(theme|color|font|layout|style)\b/gi
-    ];
-
-    return preferencePatterns.some(pattern => pattern.test(content));
+    return PREFERENCE_REGEX.test(content);
   }
 
   /**
@@ -371,7 +360,11 @@ class ContentAnalyzer {
    * Count occurrences of a term in content
    */
   countOccurrences(content, term) {
-    const regex = new RegExp(`\\b${term}\\b`, 'gi');
+    let regex = this.termRegexCache.get(term);
+    if (!regex) {
+      regex = new RegExp(`\\b${term}\\b`, 'gi');
+      this.termRegexCache.set(term, regex);
+    }
     const matches = content.match(regex);
     return matches ? matches.length : 0;
   }
@@ -420,6 +413,7 @@ class ContentAnalyzer {
         topWords.forEach(word => {
           if (!this.categoryPatterns[category].keywords.includes(word)) {
             this.categoryPatterns[category].keywords.push(word);
+            this.suggestionCache.clear();
           }
         });
       }
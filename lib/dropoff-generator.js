@@ -135,54 +135,59 @@ export class DropoffGenerator {
    */
   async getRecentMemories(count = 5) {
     try {
-      const memories = [];
       const categories = await this.getMemoryCategories();
       
-      // Collect all memory files with timestamps
-      const allMemories = [];
+      // Keep only the newest `count` files while scanning, so headers are
+      // read for those alone instead of for every memory on disk
+      const newest = [];
       
       for (const category of categories) {
+        // Categories come from directory dirents, so list them directly
         const categoryPath = path.join(this.baseDir, category);
-        if (fs.existsSync(categoryPath)) {
-          const files = fs.readdirSync(categoryPath).filter(file => file.endsWith('.md'));
+        const files = fs.readdirSync(categoryPath).filter(file => file.endsWith('.md'));
+        
+        for (const file of files) {
+          const filePath = path.join(categoryPath, file);
+          const stats = fs.statSync(filePath);
           
-          for (const file of files) {
-            const filePath = path.join(categoryPath, file);
-            const stats = fs.statSync(filePath);
-            
-            try {
-              const content = fs.readFileSync(filePath, 'utf8');
-              const parsed = this.memoryFormat.parseMemory(content);
-              
-              allMemories.push({
-                file: file,
-                category: category,
-                title: parsed.metadata.title || file.replace('.md', ''),
-                timestamp: parsed.metadata.timestamp || stats.mtime.toISOString(),
-                tags: parsed.metadata.tags || [],
-                priority: parsed.metadata.priority || 'medium',
-                mtime: stats.mtime
-              });
-            } catch (parseError) {
-              // If parsing fails, include basic file info
-              allMemories.push({
-                file: file,
-                category: category,
-                title: file.replace('.md', ''),
-                timestamp: stats.mtime.toISOString(),
-                tags: [],
-                priority: 'medium',
-                mtime: stats.mtime,
-                parseError: true
-              });
-            }
-          }
+          // Insert after any entry at least as new, matching a stable sort
+          let position = newest.length;
+          while (position > 0 && newest[position - 1].stats.mtime < stats.mtime) position--;
+          if (position >= count) continue;
+          newest.splice(position, 0, { file, category, filePath, stats });
+          if (newest.length > count) newest.pop();
         }
       }
       
-      // Sort by modification time (most recent first) and take top N
-      allMemories.sort((a, b) => b.mtime - a.mtime);
-      return allMemories.slice(0, count);
+      return newest.map(({ file, category, filePath, stats }) => {
+        try {
+          // Only the metadata is shown, so read just the frontmatter
+          const parsed = MemoryFormat.parseMemoryHeader(filePath);
+          if (!parsed) throw new Error(`No frontmatter in ${file}`);
+          
+          return {
+            file: file,
+            category: category,
+            title: parsed.metadata.title || file.replace('.md', ''),
+            timestamp: parsed.timestamp || stats.mtime.toISOString(),
+            tags: parsed.tags || [],
+            priority: parsed.priority || 'medium',
+            mtime: stats.mtime
+          };
+        } catch (parseError) {
+          // If parsing fails, include basic file info
+          return {
+            file: file,
+            category: category,
+            title: file.replace('.md', ''),
+            timestamp: stats.mtime.toISOString(),
+            tags: [],
+            priority: 'medium',
+            mtime: stats.mtime,
+            parseError: true
+          };
+        }
+      });
       
     } catch (error) {
       return [{ error: `Failed to get recent memories: ${error.message}` }];
@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import os from 'os';
+import { isDirectoryEntry } from './fs-utils.js';
 
 /**
  * Discover existing Like-I-Said folders on the system
@@ -97,11 +98,11 @@ export class FolderDiscovery {
       const hasTasks = fs.existsSync(path.join(dirPath, 'tasks'));
       
       // Check if the directory itself might be a memories/tasks folder
-      const files = await fs.promises.readdir(dirPath);
-      const hasMarkdownFiles = files.some(file => file.endsWith('.md'));
+      const files = await fs.promises.readdir(dirPath, { withFileTypes: true });
+      const hasMarkdownFiles = files.some(file => file.name.endsWith('.md'));
       const hasProjectFolders = files.some(file => {
-        const filePath = path.join(dirPath, file);
-        return fs.statSync(filePath).isDirectory() && !file.startsWith('.');
+        if (file.name.startsWith('.')) return false;
+        return isDirectoryEntry(file, dirPath);
       });
 
       return (hasMemories || hasTasks) || (hasMarkdownFiles && hasProjectFolders);
@@ -0,0 +1,39 @@
+/**
+ * File System Utilities
+ *
+ * Directory listing helpers shared by the storage layers. readdir entries
+ * (dirents) already carry their type, so only symlinks need a stat to find
+ * out whether they point at a directory.
+ */
+
+import fs from 'fs';
+import path from 'path';
+
+/**
+ * Check whether a readdir dirent is a directory, following symlinks
+ * @param {fs.Dirent} entry - Entry from readdir with withFileTypes
+ * @param {string} parentDir - Directory the entry was read from
+ * @returns {boolean} True if the entry is, or links to, a directory;
+ *   false for broken or unreadable symlinks
+ */
+export function isDirectoryEntry(entry, parentDir) {
+  if (entry.isSymbolicLink()) {
+    try {
+      return fs.statSync(path.join(parentDir, entry.name)).isDirectory();
+    } catch {
+      return false;
+    }
+  }
+  return entry.isDirectory();
+}
+
+/**
+ * List the names of the subdirectories of a directory (symlinks included)
+ * @param {string} dir - Directory to list
+ * @returns {string[]} Subdirectory names in readdir order
+ */
+export function listSubdirectories(dir) {
+  return fs.readdirSync(dir, { withFileTypes: true })
+    .filter(entry => isDirectoryEntry(entry, dir))
+    .map(entry => entry.name);
+}
@@ -11,6 +11,11 @@ import path from 'path';
 export class MemoryFormat {
   static FRONTMATTER_REGEX = /^---\r?\n([\s\S]*?)\r?\n---([\s\S]*)$/;
   static HTML_COMMENT_REGEX = /<!-- Memory Metadata\s*([\s\S]*?)\s*-->/;
+  static LINE_BREAK_REGEX = /\r?\n/;
+  static INTEGER_REGEX = /^\d+$/;
+  static FLOAT_REGEX = /^\d+\.\d+$/;
+  static HEADER_CHUNK_SIZE = 1024;
+  static MAX_HEADER_SIZE = 64 * 1024;
 
   /**
    * Parse memory content from multiple possible formats
@@ -20,9 +25,9 @@ export class MemoryFormat {
     if (!content || typeof content !== 'string') return null;
 
     // Try YAML frontmatter first (preferred format)
-    const frontmatterMatch = content.match(this.FRONTMATTER_REGEX);
-    if (frontmatterMatch) {
-      return this.parseFrontmatter(frontmatterMatch[1], frontmatterMatch[2]);
+    const sections = this.splitFrontmatter(content);
+    if (sections) {
+      return this.parseFrontmatter(sections.frontmatter, sections.body);
     }
 
     // Try HTML comment metadata (legacy format)
@@ -35,6 +40,29 @@ export class MemoryFormat {
     return null;
   }
 
+  /**
+   * Split content into frontmatter and body.
+   * Same result as FRONTMATTER_REGEX, but locates the closing fence with
+   * indexOf so the (possibly large) body is never run through the regex.
+   */
+  static splitFrontmatter(content) {
+    if (!content.startsWith('---')) return null;
+
+    let start = 3;
+    if (content[start] === '\r') start++;
+    if (content[start] !== '\n') return null;
+    start++;
+
+    const end = content.indexOf('\n---', start);
+    if (end === -1) return null;
+
+    const headerEnd = end > start && content[end - 1] === '\r' ? end - 1 : end;
+    return {
+      frontmatter: content.slice(start, headerEnd),
+      body: content.slice(end + 4)
+    };
+  }
+
   /**
    * Parse YAML frontmatter format
    */
@@ -45,7 +73,7 @@ export class MemoryFormat {
       format: 'yaml'
     };
 
-    const lines = frontmatter.split(/\r?\n/);
+    const lines = frontmatter.split(this.LINE_BREAK_REGEX);
     let inMetadata = false;
 
     lines.forEach(line => {
@@ -109,7 +137,7 @@ export class MemoryFormat {
       format: 'html-comment'
     };
 
-    const lines = metadataContent.trim().split(/\r?\n/);
+    const lines = metadataContent.trim().split(this.LINE_BREAK_REGEX);
     
     lines.forEach(line => {
       const colonIndex = line.indexOf(':');
@@ -147,12 +175,17 @@ export class MemoryFormat {
     
     // Handle JSON array format ["tag1", "tag2"]
     if (value.startsWith('[') && value.endsWith(']')) {
-      try {
-        return JSON.parse(value);
-      } catch {
-        // Fallback to comma splitting
-        return value.slice(1, -1).split(',').map(t => t.trim().replace(/['"]/g, '')).filter(Boolean);
+      // Only attempt JSON when it can be a JSON string array; unquoted
+      // [a, b] lists would otherwise always throw before falling back
+      const inner = value.slice(1, -1).trim();
+      if (inner === '' || inner[0] === '"') {
+        try {
+          return JSON.parse(value);
+        } catch {
+          // Fall through to comma splitting
+        }
       }
+      return value.slice(1, -1).split(',').map(t => t.trim().replace(/['"]/g, '')).filter(Boolean);
     }
     
     // Handle comma-separated format
@@ -165,8 +198,8 @@ export class MemoryFormat {
   static parseValue(value) {
     if (value === 'true') return true;
     if (value === 'false') return false;
-    if (/^\d+$/.test(value)) return parseInt(value);
-    if (/^\d+\.\d+$/.test(value)) return parseFloat(value);
+    if (this.INTEGER_REGEX.test(value)) return parseInt(value);
+    if (this.FLOAT_REGEX.test(value)) return parseFloat(value);
     return value;
   }
 
@@ -231,6 +264,104 @@ export class MemoryFormat {
     }
   }
 
+  /**
+   * Parse only the YAML frontmatter of a memory file.
+   * Reads the file in small chunks and stops at the closing '---', so id and
+   * timestamp lookups don't pull whole memory bodies off disk. The returned
+   * object's content is empty. Returns null when the file has no frontmatter
+   * (e.g. HTML-comment memories) - use parseMemoryFile for those.
+   */
+  static parseMemoryHeader(filepath) {
+    let fd;
+    try {
+      fd = fs.openSync(filepath, 'r');
+      const scan = { buffer: Buffer.allocUnsafe(this.HEADER_CHUNK_SIZE), length: 0 };
+      let header;
+
+      do {
+        if (!this.reserveHeaderChunk(scan)) return null;
+        const bytesRead = fs.readSync(fd, scan.buffer, scan.length, this.HEADER_CHUNK_SIZE, null);
+        header = this.consumeHeaderChunk(scan, bytesRead);
+      } while (header === undefined);
+
+      return header === null ? null : this.buildHeaderMemory(header, filepath);
+    } catch (error) {
+      console.error(`Error reading memory header ${filepath}:`, error);
+      return null;
+    } finally {
+      if (fd !== undefined) fs.closeSync(fd);
+    }
+  }
+
+  /**
+   * Async form of parseMemoryHeader, for request handlers that should not
+   * block the event loop while scanning many files
+   */
+  static async parseMemoryHeaderAsync(filepath) {
+    let handle;
+    try {
+      handle = await fs.promises.open(filepath, 'r');
+      const scan = { buffer: Buffer.allocUnsafe(this.HEADER_CHUNK_SIZE), length: 0 };
+      let header;
+
+      do {
+        if (!this.reserveHeaderChunk(scan)) return null;
+        const { bytesRead } = await handle.read(scan.buffer, scan.length, this.HEADER_CHUNK_SIZE, null);
+        header = this.consumeHeaderChunk(scan, bytesRead);
+      } while (header === undefined);
+
+      return header === null ? null : this.buildHeaderMemory(header, filepath);
+    } catch (error) {
+      console.error(`Error reading memory header ${filepath}:`, error);
+      return null;
+    } finally {
+      if (handle !== undefined) await handle.close();
+    }
+  }
+
+  /**
+   * Make room for the next chunk of a header scan. The buffer doubles when
+   * full, so a long header costs linear copying; returns false once the
+   * header would exceed MAX_HEADER_SIZE.
+   */
+  static reserveHeaderChunk(scan) {
+    if (scan.length + this.HEADER_CHUNK_SIZE <= scan.buffer.length) return true;
+    if (scan.length >= this.MAX_HEADER_SIZE) return false;
+
+    const grown = Buffer.allocUnsafe(Math.max(scan.buffer.length * 2, scan.length + this.HEADER_CHUNK_SIZE));
+    scan.buffer.copy(grown, 0, 0, scan.length);
+    scan.buffer = grown;
+    return true;
+  }
+
+  /**
+   * Account for bytes just read into the scan buffer. Returns the header
+   * text once the closing fence is found, null when there is no frontmatter
+   * to find, or undefined to keep reading. Only the new bytes (plus the
+   * three before them, for a fence split across reads) are searched.
+   */
+  static consumeHeaderChunk(scan, bytesRead) {
+    if (bytesRead === 0) return null;
+
+    const searchFrom = Math.max(3, scan.length - 3);
+    scan.length += bytesRead;
+    const filled = scan.buffer.subarray(0, scan.length);
+    if (scan.length >= 3 && filled.toString('utf8', 0, 3) !== '---') return null;
+
+    const end = filled.indexOf('\n---', searchFrom);
+    if (end === -1) return undefined;
+    return filled.toString('utf8', 0, end).replace(/^---\r?\n/, '').replace(/\r$/, '');
+  }
+
+  static buildHeaderMemory(header, filepath) {
+    const memory = this.parseFrontmatter(header, '');
+
+    memory.filename = path.basename(filepath);
+    memory.filepath = filepath;
+    if (!memory.id) memory.id = path.basename(memory.filename, '.md');
+    return memory;
+  }
+
   /**
    * Ensure memory has all required fields for compatibility
    */
@@ -245,21 +376,23 @@ export class MemoryFormat {
     if (!memory.last_accessed) memory.last_accessed = memory.timestamp;
     if (!memory.tags) memory.tags = [];
     
-    // Metadata fields
-    if (!memory.metadata) memory.metadata = {};
-    if (!memory.metadata.content_type) memory.metadata.content_type = 'text';
-    if (!memory.metadata.size) memory.metadata.size = memory.content?.length || 0;
-    if (memory.metadata.mermaid_diagram === undefined) {
-      memory.metadata.mermaid_diagram = false;
-    }
-    
-    // Dashboard compatibility fields
-    if (!memory.metadata.clients) memory.metadata.clients = [];
-    if (!memory.metadata.accessCount) memory.metadata.accessCount = memory.access_count;
-    if (!memory.metadata.created) memory.metadata.created = memory.timestamp;
-    if (!memory.metadata.modified) memory.metadata.modified = memory.timestamp;
-    if (!memory.metadata.lastAccessed) memory.metadata.lastAccessed = memory.last_accessed;
-    if (!memory.metadata.contentType) memory.metadata.contentType = memory.metadata.content_type;
+    // Metadata fields, built as one literal so every memory's metadata object
+    // is created with the same shape instead of through a chain of additions
+    const metadata = memory.metadata || {};
+    const contentType = metadata.content_type || 'text';
+    memory.metadata = {
+      ...metadata,
+      content_type: contentType,
+      size: metadata.size || memory.content?.length || 0,
+      mermaid_diagram: metadata.mermaid_diagram === undefined ? false : metadata.mermaid_diagram,
+      // Dashboard compatibility fields
+      clients: metadata.clients || [],
+      accessCount: metadata.accessCount || memory.access_count,
+      created: metadata.created || memory.timestamp,
+      modified: metadata.modified || memory.timestamp,
+      lastAccessed: metadata.lastAccessed || memory.last_accessed,
+      contentType: metadata.contentType || contentType
+    };
     
     return memory;
   }
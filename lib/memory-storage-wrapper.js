@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { MemoryFormat } from './memory-format.js';
+import { listSubdirectories } from './fs-utils.js';
 
 /**
  * Simple memory storage wrapper for dashboard-server-bridge
@@ -24,46 +25,74 @@ export class MemoryStorageWrapper {
   async listMemories() {
     const memories = [];
     
+    for (const { filePath, file } of this.listMemoryFiles()) {
+      const memory = this.readMemoryFile(filePath, file);
+      if (memory) {
+        memories.push(memory);
+      }
+    }
+
+    return memories;
+  }
+
+  /**
+   * List the .md files of every project directory
+   */
+  listMemoryFiles() {
+    const entries = [];
+    
     try {
-      const projects = fs.readdirSync(this.baseDir).filter(dir => {
-        const dirPath = path.join(this.baseDir, dir);
-        return fs.statSync(dirPath).isDirectory();
-      });
+      const projects = listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const projectDir = path.join(this.baseDir, project);
         const files = fs.readdirSync(projectDir).filter(f => f.endsWith('.md'));
         
         for (const file of files) {
-          try {
-            const filePath = path.join(projectDir, file);
-            const rawContent = fs.readFileSync(filePath, 'utf-8');
-            // Sanitize content to remove invalid Unicode sequences
-            const content = rawContent.replace(/[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]/g, '\uFFFD');
-            const memory = MemoryFormat.parseMemoryContent(content);
-            if (memory) {
-              memory.filepath = filePath;
-              memory.filename = file;
-              memories.push(memory);
-            }
-          } catch (error) {
-            console.error(`Error parsing memory file ${file}:`, error);
-          }
+          entries.push({ filePath: path.join(projectDir, file), file });
         }
       }
     } catch (error) {
       console.error('Error listing memories:', error);
     }
 
-    return memories;
+    return entries;
   }
 
   /**
-   * Get a specific memory by ID
+   * Read and parse one memory file, or null if it has no metadata
+   */
+  readMemoryFile(filePath, file) {
+    try {
+      const rawContent = fs.readFileSync(filePath, 'utf-8');
+      // Sanitize content to remove invalid Unicode sequences
+      const content = rawContent.replace(/[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]/g, '\uFFFD');
+      const memory = MemoryFormat.parseMemoryContent(content);
+      if (memory) {
+        memory.filepath = filePath;
+        memory.filename = file;
+      }
+      return memory;
+    } catch (error) {
+      console.error(`Error parsing memory file ${file}:`, error);
+      return null;
+    }
+  }
+
+  /**
+   * Get a specific memory by ID.
+   * Only frontmatter headers are read until the matching file is found.
    */
   async getMemory(id) {
-    const memories = await this.listMemories();
-    return memories.find(m => m.id === id) || null;
+    for (const { filePath, file } of this.listMemoryFiles()) {
+      // Files without frontmatter (HTML-comment format) get a full parse
+      const header = MemoryFormat.parseMemoryHeader(filePath);
+      if (header && header.id !== id) continue;
+
+      const memory = this.readMemoryFile(filePath, file);
+      if (memory && memory.id === id) return memory;
+    }
+    return null;
   }
 
   /**
@@ -7,8 +7,13 @@
  */
 
 import { platform } from 'os';
+import { existsSync } from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
 import { settingsManager } from './settings-manager.js';
 
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
 /**
  * Cache for loaded modules to avoid repeated import attempts
  */
@@ -19,6 +24,29 @@ const moduleCache = new Map();
  */
 const failedImports = new Set();
 
+/**
+ * Cache of whether each package is installed
+ */
+const availabilityCache = new Map();
+
+/**
+ * Check for a package's package.json without loading the package itself.
+ * Walks up the node_modules chain the same way Node's resolver does.
+ * @param {string} moduleName - Name of the package
+ * @returns {boolean} True if the package is installed
+ */
+function isInstalled(moduleName) {
+  let dir = __dirname;
+  while (true) {
+    if (existsSync(path.join(dir, 'node_modules', moduleName, 'package.json'))) {
+      return true;
+    }
+    const parent = path.dirname(dir);
+    if (parent === dir) return false;
+    dir = parent;
+  }
+}
+
 /**
  * Get platform-specific blocklist based on settings
  */
@@ -120,9 +148,13 @@ export async function optionalImport(moduleName, options = {}) {
 }
 
 /**
- * Check if a module is available for import
+ * Check if a module is installed and not ruled out on this platform
+ * Uses a package.json probe instead of a full import, so heavy modules
+ * (e.g. @xenova/transformers) are not loaded just to answer this question.
+ * A package that is installed but fails to load (such as a broken native
+ * build) still reports true until an optionalImport of it has failed.
  * @param {string} moduleName - Name of the module to check
- * @returns {Promise<boolean>} True if module can be imported
+ * @returns {Promise<boolean>} True if the module was loaded or its package is installed
  */
 export async function isModuleAvailable(moduleName) {
   if (moduleCache.has(moduleName)) {
@@ -133,12 +165,10 @@ export async function isModuleAvailable(moduleName) {
     return false;
   }
 
-  try {
-    await optionalImport(moduleName);
-    return true;
-  } catch {
-    return false;
+  if (!availabilityCache.has(moduleName)) {
+    availabilityCache.set(moduleName, isInstalled(moduleName));
   }
+  return availabilityCache.get(moduleName);
 }
 
 /**
@@ -179,6 +209,7 @@ export function createLazyModule(moduleName, fallbackImplementation = {}) {
 export function clearCaches() {
   moduleCache.clear();
   failedImports.clear();
+  availabilityCache.clear();
 }
 
 /**
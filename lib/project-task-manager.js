@@ -1,6 +1,7 @@
 import fs from 'fs';
 import path from 'path';
 import { TaskFormat } from './task-format.js';
+import { listSubdirectories } from './fs-utils.js';
 
 /**
  * Manages tasks organized by project in markdown files
@@ -35,10 +36,7 @@ export class ProjectTaskManager {
     const tasks = [];
     
     try {
-      const projects = fs.readdirSync(this.baseDir).filter(dir => {
-        const dirPath = path.join(this.baseDir, dir);
-        return fs.statSync(dirPath).isDirectory();
-      });
+      const projects = listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const projectTasks = this.getProjectTasks(project);
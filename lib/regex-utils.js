@@ -0,0 +1,16 @@
+/**
+ * Regex Utilities
+ *
+ * Helpers for building regular expressions from user-supplied text.
+ */
+
+const REGEX_SPECIAL_CHARS = /[.*+?^${}()|[\]\\]/g;
+
+/**
+ * Escape a string so it matches literally inside a RegExp
+ * @param {string} text - Text to escape
+ * @returns {string} Text with regex metacharacters backslash-escaped
+ */
+export function escapeRegExp(text) {
+  return text.replace(REGEX_SPECIAL_CHARS, '\\$&');
+}
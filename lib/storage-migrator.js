@@ -16,7 +16,6 @@
 
 import fs from 'fs-extra';
 import path from 'path';
-import crypto from 'crypto';
 import UnifiedStorage from './unified-storage.js';
 
 class StorageMigrator {
@@ -297,25 +296,24 @@ class StorageMigrator {
                 fileName
             );
 
-            // Read and validate source file
-            const sourceContent = await fs.readFile(sourceFilePath, 'utf8');
-            const sourceHash = this.generateHash(sourceContent);
+            // Read raw bytes; duplicates are detected by comparing them
+            // directly, so files are only decoded when they actually conflict
+            const sourceContent = await fs.readFile(sourceFilePath);
 
             // Check if target exists
             const targetExists = await fs.pathExists(targetPath);
             
             if (targetExists) {
-                const targetContent = await fs.readFile(targetPath, 'utf8');
-                const targetHash = this.generateHash(targetContent);
+                const targetContent = await fs.readFile(targetPath);
                 
-                if (sourceHash === targetHash) {
+                if (sourceContent.equals(targetContent)) {
                     // Files are identical - skip
                     console.log(`⏭️  Skipped duplicate: ${fileName}`);
                     this.migrationReport.results[`${dataType}Skipped`]++;
                     return;
                 } else {
                     // Files are different - resolve conflict
-                    await this.resolveConflict(sourceFilePath, targetPath, sourceContent, targetContent, dataType);
+                    await this.resolveConflict(sourceFilePath, targetPath, sourceContent.toString('utf8'), targetContent.toString('utf8'), dataType);
                     return;
                 }
             }
@@ -323,7 +321,7 @@ class StorageMigrator {
             // Migrate file
             if (!this.options.dryRun) {
                 await fs.ensureDir(path.dirname(targetPath));
-                await fs.writeFile(targetPath, sourceContent, 'utf8');
+                await fs.writeFile(targetPath, sourceContent);
             }
 
             console.log(`✅ Migrated: ${dataType}/${projectName}/${fileName}`);
@@ -392,13 +390,6 @@ class StorageMigrator {
         }
     }
 
-    /**
-     * Generate hash for content comparison
-     */
-    generateHash(content) {
-        return crypto.createHash('md5').update(content).digest('hex');
-    }
-
     /**
      * Create backup of current unified storage
      */
@@ -1,6 +1,13 @@
 import fs from 'fs';
 import path from 'path';
 import yaml from 'js-yaml';
+import { listSubdirectories } from './fs-utils.js';
+
+// Task frontmatter only ever contains plain scalars, lists and maps, so the
+// CORE schema is enough. It skips the timestamp/merge/binary resolvers that
+// the default schema runs on every scalar, which makes load/dump noticeably
+// cheaper.
+const YAML_SCHEMA = yaml.CORE_SCHEMA;
 
 /**
  * Task Format Handler - Manages markdown task files with YAML frontmatter
@@ -9,6 +16,30 @@ import yaml from 'js-yaml';
 export class TaskFormat {
   // Regex patterns for different task formats
   static FRONTMATTER_REGEX = /^---\r?\n([\s\S]*?)\r?\n---\r?\n([\s\S]*)$/;
+
+  // Shared js-yaml options for every task frontmatter load/dump
+  static YAML_LOAD_OPTIONS = { schema: YAML_SCHEMA };
+  static YAML_DUMP_OPTIONS = {
+    schema: YAML_SCHEMA,
+    lineWidth: -1,
+    noRefs: true,
+    sortKeys: false
+  };
+
+  // Strings that can be written as plain YAML scalars and still read back as
+  // the same string. Anything else is emitted as a JSON string, which is a
+  // valid YAML double-quoted scalar.
+  static PLAIN_SCALAR_REGEX = /^[A-Za-z_][\w\-.\/]*(?: [\w\-.\/]+)*$/;
+  static RESERVED_SCALAR_REGEX = /^(?:true|false|null)$/i;
+
+  // Line shapes accepted by the flat frontmatter fast path (see parseFlatYaml)
+  static FLAT_KEY_REGEX = /^([A-Za-z_][\w-]*):(?: (.*))?$/;
+  static FLAT_LIST_ITEM_REGEX = /^( *)- (.*)$/;
+  // Plain decimals; a bare -0 is left to js-yaml, which reads it as the int 0
+  static FLAT_NUMBER_REGEX = /^(?:-?[1-9]\d*|0|-0(?=\.))(?:\.\d+)?$/;
+  static SINGLE_QUOTED_REGEX = /^'((?:[^']|'')*)'$/;
+  // Characters JSON.stringify leaves raw but js-yaml refuses to load
+  static YAML_NON_PRINTABLE_REGEX = /[\u007f-\u0084\u0086-\u009f\ufffe\uffff]/;
   
   /**
    * Parse task content from markdown with YAML frontmatter
@@ -36,8 +67,8 @@ export class TaskFormat {
     };
 
     try {
-      // Parse YAML frontmatter
-      const yamlData = yaml.load(frontmatter);
+      // Parse YAML frontmatter, skipping js-yaml for the flat shape we write
+      const yamlData = this.parseFlatYaml(frontmatter) ?? yaml.load(frontmatter, this.YAML_LOAD_OPTIONS);
       
       // Merge YAML data into task object
       Object.assign(task, yamlData);
@@ -49,6 +80,93 @@ export class TaskFormat {
     }
   }
 
+  /**
+   * Parse frontmatter made only of `key: scalar`, `key: []` and `key:` followed
+   * by `- scalar` or `- {json object}` items, which covers what emitYamlField
+   * writes. Returns undefined for anything else (block maps, comments, other
+   * flow collections, unusual scalars, duplicate keys) so the caller can fall
+   * back to yaml.load.
+   */
+  static parseFlatYaml(frontmatter) {
+    const data = {};
+    let listKey = null;
+    let listIndent = null;
+
+    for (const line of frontmatter.split('\n')) {
+      if (line === '') continue;
+
+      const item = listKey !== null && line.match(this.FLAT_LIST_ITEM_REGEX);
+      if (item) {
+        if (listIndent === null) listIndent = item[1];
+        else if (item[1] !== listIndent) return undefined;
+        const value = item[2].startsWith('{') ? this.parseJsonRecord(item[2]) : this.parseFlatScalar(item[2]);
+        if (value === undefined) return undefined;
+        if (data[listKey] === null) data[listKey] = [];
+        data[listKey].push(value);
+        continue;
+      }
+
+      const field = line.match(this.FLAT_KEY_REGEX);
+      if (!field || field[1] === '__proto__' || Object.hasOwn(data, field[1])) return undefined;
+
+      const [, key, rawValue = ''] = field;
+      listKey = null;
+      if (rawValue === '') {
+        // Either null or the start of a block list
+        data[key] = null;
+        listKey = key;
+        listIndent = null;
+      } else if (rawValue === '~') {
+        data[key] = null;
+      } else if (rawValue === '[]') {
+        data[key] = [];
+      } else {
+        const value = this.parseFlatScalar(rawValue);
+        if (value === undefined) return undefined;
+        data[key] = value;
+      }
+    }
+
+    return data;
+  }
+
+  /**
+   * Read a list item written by emitYamlField as a JSON object
+   */
+  static parseJsonRecord(text) {
+    try {
+      const value = JSON.parse(text);
+      return value !== null && typeof value === 'object' && !Array.isArray(value) ? value : undefined;
+    } catch {
+      return undefined;
+    }
+  }
+
+  /**
+   * Resolve a scalar the way the CORE schema would, or undefined if it is
+   * not one of the simple forms handled here
+   */
+  static parseFlatScalar(text) {
+    if (text.startsWith('"')) {
+      try {
+        const value = JSON.parse(text);
+        return typeof value === 'string' ? value : undefined;
+      } catch {
+        return undefined;
+      }
+    }
+    if (text.startsWith("'")) {
+      const quoted = text.match(this.SINGLE_QUOTED_REGEX);
+      return quoted ? quoted[1].replace(/''/g, "'") : undefined;
+    }
+    if (text === 'null') return null;
+    if (text === 'true') return true;
+    if (text === 'false') return false;
+    if (this.FLAT_NUMBER_REGEX.test(text)) return Number(text);
+    if (this.PLAIN_SCALAR_REGEX.test(text) && !this.RESERVED_SCALAR_REGEX.test(text)) return text;
+    return undefined;
+  }
+
   /**
    * Generate markdown content with YAML frontmatter
    */
@@ -75,22 +193,73 @@ export class TaskFormat {
       memory_connections: task.memory_connections || []
     };
 
-    // Remove undefined values
-    Object.keys(frontmatter).forEach(key => {
-      if (frontmatter[key] === undefined) {
-        delete frontmatter[key];
+    // Skip undefined values (rather than deleting them, which would drop
+    // the object out of V8's fast-property mode)
+    let yamlString = '';
+    for (const [key, value] of Object.entries(frontmatter)) {
+      if (value !== undefined) {
+        yamlString += this.emitYamlField(key, value);
       }
-    });
-
-    const yamlString = yaml.dump(frontmatter, {
-      lineWidth: -1,
-      noRefs: true,
-      sortKeys: false
-    });
+    }
 
     return `---\n${yamlString}---\n${task.description || ''}\n`;
   }
 
+  /**
+   * Emit one frontmatter field. The task schema is fixed and almost entirely
+   * scalars, string lists and lists of flat records (memory_connections), so
+   * those are written directly; any other shape goes through yaml.dump.
+   */
+  static emitYamlField(key, value) {
+    if (Array.isArray(value)) {
+      if (value.length === 0) return `${key}: []\n`;
+      if (value.every(item => typeof item === 'string')) {
+        return `${key}:\n` + value.map(item => `  - ${this.emitYamlScalar(item)}\n`).join('');
+      }
+      // A JSON object is a valid YAML flow mapping, so records are written as
+      // one JSON line each and read back with JSON.parse by parseFlatYaml
+      if (value.every(item => this.isJsonRecord(item))) {
+        return `${key}:\n` + value.map(item => `  - ${JSON.stringify(item)}\n`).join('');
+      }
+    } else if (value === null || value instanceof Date || typeof value !== 'object') {
+      return `${key}: ${this.emitYamlScalar(value)}\n`;
+    }
+
+    return yaml.dump({ [key]: value }, this.YAML_DUMP_OPTIONS);
+  }
+
+  /**
+   * Whether a list item is a plain object whose JSON form js-yaml reads back
+   * as the same object: string, finite number, boolean or null values, or
+   * lists of strings
+   */
+  static isJsonRecord(item) {
+    if (item === null || typeof item !== 'object' || Object.getPrototypeOf(item) !== Object.prototype) {
+      return false;
+    }
+    const isJsonString = text => typeof text === 'string' && !this.YAML_NON_PRINTABLE_REGEX.test(text);
+    return Object.values(item).every(value =>
+      value === null || typeof value === 'boolean' || isJsonString(value) ||
+      (typeof value === 'number' && Number.isFinite(value)) ||
+      (Array.isArray(value) && value.every(isJsonString)));
+  }
+
+  /**
+   * Emit a scalar value that reads back unchanged under YAML_LOAD_OPTIONS
+   */
+  static emitYamlScalar(value) {
+    if (value === null) return 'null';
+    if (value instanceof Date) return JSON.stringify(value.toISOString());
+    if (typeof value === 'number') return Number.isFinite(value) ? String(value) : JSON.stringify(String(value));
+    if (typeof value === 'boolean') return String(value);
+
+    const text = String(value);
+    if (this.PLAIN_SCALAR_REGEX.test(text) && !this.RESERVED_SCALAR_REGEX.test(text)) {
+      return text;
+    }
+    return JSON.stringify(text);
+  }
+
   /**
    * Parse multiple tasks from content (for project-based files)
    */
@@ -265,8 +434,7 @@ export class TaskFormat {
       return tasks;
     }
 
-    const projects = project ? [project] : fs.readdirSync(projectsDir)
-      .filter(dir => fs.statSync(path.join(projectsDir, dir)).isDirectory());
+    const projects = project ? [project] : listSubdirectories(projectsDir);
 
     for (const proj of projects) {
       const taskFiles = this.getTaskFiles(proj);
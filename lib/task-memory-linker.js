@@ -1,4 +1,5 @@
 import { VectorStorage } from './vector-storage.js';
+import { escapeRegExp } from './regex-utils.js';
 
 export class TaskMemoryLinker {
   constructor(memoryStorage, taskStorage) {
@@ -112,6 +113,12 @@ export class TaskMemoryLinker {
     
     console.error(`[TaskMemoryLinker] Extracted terms:`, terms);
     
+    // One alternation pass per memory rules out the common no-match case
+    // before the per-term checks that record which terms matched
+    const keywordPattern = this.buildTermPattern(terms.keywords);
+    const technicalPattern = this.buildTermPattern(terms.technical);
+    const taskDate = new Date(task.created);
+    
     // Filter memories by various criteria
     const candidates = [];
     
@@ -140,26 +147,29 @@ export class TaskMemoryLinker {
         matchedTerms.push(...commonTags.map(tag => `tag:${tag}`));
       }
       
-      // Keyword matches in content
+      // Keyword matches in content (keywords are already lowercase)
       const contentLower = memory.content.toLowerCase();
-      for (const keyword of terms.keywords) {
-        if (contentLower.includes(keyword.toLowerCase())) {
-          isCandidate = true;
-          matchedTerms.push(keyword);
+      if (keywordPattern && keywordPattern.test(contentLower)) {
+        for (const keyword of terms.keywords) {
+          if (contentLower.includes(keyword)) {
+            isCandidate = true;
+            matchedTerms.push(keyword);
+          }
         }
       }
       
       // Technical term matches
-      for (const tech of terms.technical) {
-        if (memory.content.includes(tech)) {
-          isCandidate = true;
-          matchedTerms.push(`tech:${tech}`);
+      if (technicalPattern && technicalPattern.test(memory.content)) {
+        for (const tech of terms.technical) {
+          if (memory.content.includes(tech)) {
+            isCandidate = true;
+            matchedTerms.push(`tech:${tech}`);
+          }
         }
       }
       
       // Time proximity (last 14 days)
       const memoryDate = new Date(memory.timestamp);
-      const taskDate = new Date(task.created);
       const daysDiff = Math.abs(taskDate - memoryDate) / (1000 * 60 * 60 * 24);
       if (daysDiff <= 14) {
         isCandidate = true;
@@ -280,7 +290,23 @@ export class TaskMemoryLinker {
     };
   }
 
+  /**
+   * Match any of the given literal terms in a single regex pass, or null
+   * when there are none
+   */
+  buildTermPattern(terms, { wholeWords = false, flags = '' } = {}) {
+    if (terms.length === 0) return null;
+    const alternation = terms.map(escapeRegExp).join('|');
+    return new RegExp(wholeWords ? `\\b(?:${alternation})\\b` : alternation, flags);
+  }
+
   async rankByRelevance(memories, task) {
+    // The task's terms are the same for every memory, so extract them once.
+    // Keywords are distinct whole words, so one alternation finds exactly the
+    // matches the per-keyword regexes used to count.
+    const terms = this.extractSearchTerms(task);
+    const keywordPattern = this.buildTermPattern(terms.keywords, { wholeWords: true, flags: 'gi' });
+
     return memories.map(memory => {
       let score = 0;
       const factors = [];
@@ -314,15 +340,8 @@ export class TaskMemoryLinker {
       }
       
       // Keyword density (reduced weight with semantic search)
-      const terms = this.extractSearchTerms(task);
       const contentLower = memory.content.toLowerCase();
-      let keywordMatches = 0;
-      
-      for (const keyword of terms.keywords) {
-        const regex = new RegExp(`\\b${keyword}\\b`, 'gi');
-        const matches = (contentLower.match(regex) || []).length;
-        keywordMatches += matches;
-      }
+      const keywordMatches = keywordPattern ? (contentLower.match(keywordPattern) || []).length : 0;
       
       if (keywordMatches > 0) {
         const keywordScore = Math.min(keywordMatches / 10, 1) * 0.10;
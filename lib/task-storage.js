@@ -33,6 +33,16 @@ export class TaskStorage {
     return path.join(projectDir, 'tasks.md');
   }
 
+  /**
+   * Replace a project's tasks.md in one step: write a temp file, then rename
+   * it over the original so a crash mid-write cannot truncate the project
+   */
+  writeProjectFile(filePath, content) {
+    const tempPath = `${filePath}.tmp`;
+    fs.writeFileSync(tempPath, content);
+    fs.renameSync(tempPath, filePath);
+  }
+
   /**
    * Add or update task in project file
    */
@@ -70,7 +80,7 @@ export class TaskStorage {
     }
     
     // Write the updated content
-    fs.writeFileSync(filePath, newContent);
+    this.writeProjectFile(filePath, newContent);
     
     return task;
   }
@@ -152,7 +162,7 @@ export class TaskStorage {
       newContent += '\n\n' + TaskFormat.toMarkdown(task);
     }
     
-    fs.writeFileSync(filePath, newContent);
+    this.writeProjectFile(filePath, newContent);
     
     return tasks[taskIndex];
   }
@@ -185,7 +195,7 @@ export class TaskStorage {
       newContent += '\n\n' + TaskFormat.toMarkdown(task);
     }
     
-    fs.writeFileSync(filePath, newContent);
+    this.writeProjectFile(filePath, newContent);
   }
 
   generateTaskId() {
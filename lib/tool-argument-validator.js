@@ -0,0 +1,39 @@
+/**
+ * Tool Argument Validator
+ *
+ * Checks MCP tool call arguments against each tool's inputSchema before the
+ * handler runs. Arguments are validated as given - nothing is coerced or
+ * rewritten - so bad input is reported instead of being turned into a
+ * different valid value.
+ */
+
+import Ajv from 'ajv';
+
+/**
+ * Wrap tool handlers so each call is validated against its tool's schema
+ * @param {Array<{name: string, inputSchema: Object}>} tools - Tool definitions
+ * @param {Map<string, Function>} handlers - Tool name -> handler(args)
+ * @returns {Map<string, Function>} Tool name -> validating handler(args)
+ */
+export function withArgumentValidation(tools, handlers) {
+  const ajv = new Ajv({ strict: false });
+  const schemas = new Map(tools.map(tool => [tool.name, tool.inputSchema]));
+  // Each schema is compiled the first time its tool is called
+  const validators = new Map();
+
+  const validated = new Map();
+  for (const [name, handler] of handlers) {
+    validated.set(name, args => {
+      let validate = validators.get(name);
+      if (!validate) {
+        validate = ajv.compile(schemas.get(name) || {});
+        validators.set(name, validate);
+      }
+      if (!validate(args)) {
+        throw new Error(`Invalid arguments for ${name}: ${ajv.errorsText(validate.errors)}`);
+      }
+      return handler(args);
+    });
+  }
+  return validated;
+}
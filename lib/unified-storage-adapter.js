@@ -10,6 +10,17 @@
 import UnifiedStorage from './unified-storage.js';
 import fs from 'fs-extra';
 import path from 'path';
+import { isDirectoryEntry, listSubdirectories } from './fs-utils.js';
+import { escapeRegExp } from './regex-utils.js';
+import { MemoryFormat } from './memory-format.js';
+
+// Max number of files stat'ed/read at once while refreshing the memory index
+// or loading project task files
+const INDEX_READ_CONCURRENCY = 32;
+
+// Prebuilt index snapshot (see scripts/maintenance/build-memory-index.js)
+const INDEX_SNAPSHOT_FILE = 'memory-index.json';
+const INDEX_SNAPSHOT_VERSION = 1;
 
 class UnifiedMemoryStorage {
   constructor(baseDir = 'memories') {
@@ -20,15 +31,208 @@ class UnifiedMemoryStorage {
       createBackups: true
     });
     this.initialized = false;
+    this.memoryIndex = new Map(); // In-memory index: id -> parsed memory
+    this.fileIndex = new Map();   // filepath -> { id, mtimeMs, ftsRowId } for change detection
+    this.searchDb = null;         // Optional in-memory SQLite FTS5 index for searchMemories
+    this.ftsRowId = 0;
+    this.recentOrder = null;      // [filepath, entry] newest first; null when the index changed
   }
 
   async initialize() {
     if (!this.initialized) {
       await this.unifiedStorage.initialize();
+      await this.initSearchIndex();
+      await this.loadIndexSnapshot();
       this.initialized = true;
     }
   }
 
+  /**
+   * Seed the index from a prebuilt snapshot, if one exists. Entries are
+   * still validated by mtime on the next refresh, so a stale snapshot only
+   * costs the re-parse of files that changed since it was written.
+   */
+  async loadIndexSnapshot() {
+    const snapshotPath = this.unifiedStorage.join(this.unifiedStorage.unifiedPath, INDEX_SNAPSHOT_FILE);
+
+    try {
+      if (!await fs.pathExists(snapshotPath)) return;
+
+      const snapshot = JSON.parse(await fs.readFile(snapshotPath, 'utf8'));
+      if (snapshot.version !== INDEX_SNAPSHOT_VERSION) return;
+
+      for (const [filePath, { mtimeMs, memory }] of Object.entries(snapshot.files || {})) {
+        this.indexMemory(memory, filePath, mtimeMs);
+      }
+    } catch (error) {
+      console.error('[UnifiedMemoryStorage] Ignoring unreadable index snapshot:', error.message);
+    }
+  }
+
+  /**
+   * Refresh the index and write it out as a snapshot for faster startup
+   * @returns {Promise<{path: string, count: number}>}
+   */
+  async saveIndexSnapshot() {
+    await this.initialize();
+    await this.refreshIndex();
+
+    const files = {};
+    for (const [filePath, entry] of this.fileIndex) {
+      const memory = entry.id && this.memoryIndex.get(entry.id);
+      if (memory && memory.filepath === filePath) {
+        files[filePath] = { mtimeMs: entry.mtimeMs, memory };
+      }
+    }
+
+    // The snapshot is derived data, so it is replaced in place (temp file +
+    // rename) rather than going through writeFile's backup copies
+    const snapshotPath = this.unifiedStorage.join(this.unifiedStorage.unifiedPath, INDEX_SNAPSHOT_FILE);
+    const tempPath = `${snapshotPath}.tmp`;
+    await fs.writeFile(tempPath, JSON.stringify({ version: INDEX_SNAPSHOT_VERSION, files }), 'utf8');
+    await fs.rename(tempPath, snapshotPath);
+    return { path: snapshotPath, count: Object.keys(files).length };
+  }
+
+  /**
+   * Open an in-memory FTS5 table for full-text search.
+   * Text is lowercased in JS before it is indexed and the trigram tokenizer
+   * matches case-sensitively, so a match is an exact substring test on the
+   * same strings the plain scan uses - SQLite's own case folding never
+   * decides a result. Falls back to scanning if better-sqlite3 is unavailable.
+   */
+  async initSearchIndex() {
+    try {
+      const Database = (await import('better-sqlite3')).default;
+      const db = new Database(':memory:');
+      db.exec(`CREATE VIRTUAL TABLE memory_fts USING fts5(id UNINDEXED, content, tags, tokenize='trigram case_sensitive 1')`);
+      this.searchStatements = {
+        insert: db.prepare('INSERT INTO memory_fts(rowid, id, content, tags) VALUES (?, ?, ?, ?)'),
+        remove: db.prepare('DELETE FROM memory_fts WHERE rowid = ?'),
+        match: db.prepare('SELECT id FROM memory_fts WHERE memory_fts MATCH ?')
+      };
+      this.searchDb = db;
+    } catch (error) {
+      console.error('[UnifiedMemoryStorage] Full-text index unavailable, using scan search:', error.message);
+      this.searchDb = null;
+    }
+  }
+
+  /**
+   * Bring the in-memory index up to date with the memories directory.
+   * Only files whose mtime changed since the last refresh are re-read and
+   * re-parsed; entries for files that disappeared are dropped. Project
+   * directories are listed concurrently, and file stats and reads are issued
+   * in parallel batches of INDEX_READ_CONCURRENCY.
+   */
+  async refreshIndex() {
+    const memoriesPath = this.unifiedStorage.join(this.unifiedStorage.unifiedPath, 'memories');
+    const filePaths = [];
+    const missing = new Set();
+
+    if (await this.unifiedStorage.exists('memories')) {
+      // Dirents carry the entry type, so no stat per project or file is needed
+      const projects = await fs.readdir(memoriesPath, { withFileTypes: true });
+
+      // Project directories are listed concurrently; results keep readdir order
+      const listings = await Promise.all(projects.map(async project => {
+        const projectPath = this.unifiedStorage.join(memoriesPath, project.name);
+        if (!isDirectoryEntry(project, memoriesPath)) return [];
+
+        const files = await fs.readdir(projectPath, { withFileTypes: true });
+        return files
+          .filter(file => file.name.endsWith('.md') && !file.isDirectory())
+          .map(file => this.unifiedStorage.join(projectPath, file.name));
+      }));
+
+      for (const listing of listings) {
+        filePaths.push(...listing);
+      }
+    }
+
+    for (let i = 0; i < filePaths.length; i += INDEX_READ_CONCURRENCY) {
+      const batch = filePaths.slice(i, i + INDEX_READ_CONCURRENCY);
+      const loaded = await Promise.all(batch.map(async filePath => {
+        try {
+          const { mtimeMs } = await fs.stat(filePath);
+          const cached = this.fileIndex.get(filePath);
+          if (cached && cached.mtimeMs === mtimeMs) return null;
+          return { filePath, mtimeMs, content: await fs.readFile(filePath, 'utf8') };
+        } catch (error) {
+          // Deleted or renamed since the directory was listed (e.g. by the
+          // dashboard); leave it out so the sweep below drops its entry
+          if (error.code !== 'ENOENT') throw error;
+          return { filePath, missing: true };
+        }
+      }));
+
+      for (const file of loaded) {
+        if (file && file.missing) {
+          missing.add(file.filePath);
+        } else if (file) {
+          this.indexMemory(this.parseMarkdownMemory(file.content, file.filePath), file.filePath, file.mtimeMs);
+        }
+      }
+    }
+
+    const seen = new Set(filePaths.filter(filePath => !missing.has(filePath)));
+    for (const filePath of this.fileIndex.keys()) {
+      if (!seen.has(filePath)) {
+        this.unindexFile(filePath);
+      }
+    }
+  }
+
+  indexMemory(memory, filePath, mtimeMs) {
+    // Drop whatever this file held before (its id may have changed)
+    this.unindexFile(filePath);
+    this.recentOrder = null;
+    const entry = {
+      id: memory ? memory.id : null,
+      mtimeMs,
+      timestampMs: (memory && Date.parse(memory.timestamp)) || 0, // parsed once for sorting
+      searchText: memory ? this.buildSearchText(memory) : '',
+      ftsRowId: null
+    };
+    this.fileIndex.set(filePath, entry);
+    if (memory && memory.id) {
+      this.memoryIndex.set(memory.id, memory);
+
+      if (this.searchDb) {
+        entry.ftsRowId = ++this.ftsRowId;
+        this.searchStatements.insert.run(
+          entry.ftsRowId,
+          memory.id,
+          (memory.content || '').toLowerCase(),
+          (memory.tags || []).join('\n').toLowerCase()
+        );
+      }
+    }
+  }
+
+  /**
+   * Lowercased content and tags, computed once per indexed file so searches
+   * don't lowercase every memory on every query. NUL separates the fields so
+   * a query can't match across a content/tag boundary.
+   */
+  buildSearchText(memory) {
+    return [memory.content || '', ...(memory.tags || [])].join('\0').toLowerCase();
+  }
+
+  unindexFile(filePath) {
+    const entry = this.fileIndex.get(filePath);
+    if (!entry) return;
+    this.fileIndex.delete(filePath);
+    this.recentOrder = null;
+    if (this.searchDb && entry.ftsRowId !== null) {
+      this.searchStatements.remove.run(entry.ftsRowId);
+    }
+    const memory = entry.id && this.memoryIndex.get(entry.id);
+    if (memory && memory.filepath === filePath) {
+      this.memoryIndex.delete(entry.id);
+    }
+  }
+
   async addMemory(content, project = 'default', category, tags, priority) {
     await this.initialize();
     
@@ -47,7 +251,10 @@ class UnifiedMemoryStorage {
     const filename = `memories/${project}/${memory.id}.md`;
     const markdownContent = this.generateMarkdownContent(memory);
     
-    await this.unifiedStorage.writeFile(filename, markdownContent);
+    const savedPath = await this.unifiedStorage.writeFile(filename, markdownContent);
+    const savedStat = await fs.stat(savedPath);
+    // Index what a read of the file returns, not the pre-write object
+    this.indexMemory(this.parseMarkdownMemory(markdownContent, savedPath), savedPath, savedStat.mtimeMs);
     
     // UNIFIED STORAGE ONLY - No legacy fallback to prevent fragmentation
     console.log(`📁 [UNIFIED] Memory saved to: ${this.unifiedStorage.unifiedPath}/${filename}`);
@@ -61,55 +268,128 @@ class UnifiedMemoryStorage {
 
   async listMemories(filters = {}) {
     await this.initialize();
-    
-    const memoriesPath = this.unifiedStorage.join(this.unifiedStorage.unifiedPath, 'memories');
-    const memories = [];
 
     try {
-      if (await this.unifiedStorage.exists('memories')) {
-        const projects = await fs.readdir(memoriesPath);
-        
-        for (const project of projects) {
-          const projectPath = this.unifiedStorage.join(memoriesPath, project);
-          const stat = await fs.stat(projectPath);
-          
-          if (stat.isDirectory()) {
-            const files = await fs.readdir(projectPath);
-            
-            for (const file of files) {
-              if (file.endsWith('.md')) {
-                const filePath = this.unifiedStorage.join(projectPath, file);
-                const content = await fs.readFile(filePath, 'utf8');
-                const memory = this.parseMarkdownMemory(content, filePath);
-                
-                if (memory && this.matchesFilters(memory, filters)) {
-                  memories.push(memory);
-                }
-              }
-            }
-          }
-        }
-      }
+      await this.refreshIndex();
     } catch (error) {
       console.error('Error listing memories:', error);
       // Fallback to legacy storage
       return this.legacyStorage.listMemories(filters);
     }
 
-    return memories.sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
+    // Walk the cached newest-first order so limit=N stops after N matches
+    const limit = filters.limit > 0 ? filters.limit : Infinity;
+    const memories = [];
+    for (const [filePath, entry] of this.getRecentOrder()) {
+      const memory = this.memoryIndex.get(entry.id);
+      if (!memory || memory.filepath !== filePath) continue;
+
+      if (this.matchesFilters(memory, filters)) {
+        memories.push(this.copyMemory(memory));
+        if (memories.length >= limit) break;
+      }
+    }
+
+    return memories;
   }
 
-  async searchMemories(query) {
-    const allMemories = await this.listMemories();
-    return allMemories.filter(memory =>
-      memory.content.toLowerCase().includes(query.toLowerCase()) ||
-      (memory.tags && memory.tags.some(tag => tag.toLowerCase().includes(query.toLowerCase())))
-    );
+  /**
+   * Indexed files ordered newest first. Re-sorted only after the index has
+   * changed, so repeated listings of an unchanged store skip the sort.
+   */
+  getRecentOrder() {
+    if (!this.recentOrder) {
+      this.recentOrder = [...this.fileIndex.entries()]
+        .filter(([, entry]) => entry.id)
+        .sort((a, b) => b[1].timestampMs - a[1].timestampMs);
+    }
+    return this.recentOrder;
+  }
+
+  async searchMemories(query, options = {}) {
+    await this.initialize();
+
+    try {
+      await this.refreshIndex();
+    } catch (error) {
+      console.error('Error searching memories:', error);
+      return this.legacyStorage.searchMemories(query);
+    }
+
+    const needle = query.toLowerCase();
+    const limit = options.limit > 0 ? options.limit : Infinity;
+    let candidateIds = null;
+
+    // Trigram matching needs at least 3 characters, and only the scan text
+    // joins fields with NUL; shorter queries and queries with NUL scan
+    if (this.searchDb && [...needle].length >= 3 && !needle.includes('\0')) {
+      const phrase = `"${needle.replace(/"/g, '""')}"`;
+      candidateIds = new Set(this.searchStatements.match.all(phrase).map(row => row.id));
+    }
+
+    // Walk the cached newest-first order against the pre-lowercased search
+    // text, so results come out sorted and limit=N stops after N hits
+    const results = [];
+    for (const [filePath, entry] of this.getRecentOrder()) {
+      if (candidateIds && !candidateIds.has(entry.id)) continue;
+      if (!entry.searchText.includes(needle)) continue;
+
+      const memory = this.memoryIndex.get(entry.id);
+      if (!memory || memory.filepath !== filePath) continue;
+
+      results.push(this.copyMemory(memory));
+      if (results.length >= limit) break;
+    }
+
+    return results;
   }
 
   async getMemory(id) {
-    const memories = await this.listMemories();
-    return memories.find(m => m.id === id);
+    await this.initialize();
+
+    try {
+      return await this.lookupMemory(id);
+    } catch (error) {
+      console.error('Error refreshing memory index:', error);
+      return this.legacyStorage.getMemory(id);
+    }
+  }
+
+  /**
+   * Resolve a memory by id through the index. A known id costs one stat of
+   * its own file (re-parsed only if it changed); the full directory refresh
+   * is only needed for ids the index hasn't seen or whose file moved.
+   */
+  async lookupMemory(id) {
+    const memory = this.memoryIndex.get(id);
+    if (memory) {
+      const filePath = memory.filepath;
+      const stat = await fs.stat(filePath).catch(() => null);
+
+      if (stat) {
+        if (this.fileIndex.get(filePath)?.mtimeMs !== stat.mtimeMs) {
+          const content = await fs.readFile(filePath, 'utf8');
+          this.indexMemory(this.parseMarkdownMemory(content, filePath), filePath, stat.mtimeMs);
+        }
+        if (this.memoryIndex.has(id)) {
+          return this.copyMemory(this.memoryIndex.get(id));
+        }
+      } else {
+        this.unindexFile(filePath);
+      }
+    }
+
+    await this.refreshIndex();
+    const refreshed = this.memoryIndex.get(id);
+    return refreshed && this.copyMemory(refreshed);
+  }
+
+  /**
+   * Copy of an indexed memory for callers, so changes they make (e.g.
+   * attaching task connections) never leak into the shared index
+   */
+  copyMemory(memory) {
+    return { ...memory, tags: memory.tags && [...memory.tags] };
   }
 
   async deleteMemory(id) {
@@ -122,6 +402,7 @@ class UnifiedMemoryStorage {
         const relativePath = path.relative(this.unifiedStorage.unifiedPath, memory.filepath);
         if (await this.unifiedStorage.exists(relativePath)) {
           await fs.remove(memory.filepath);
+          this.unindexFile(memory.filepath);
           
           // Also delete from legacy storage for consistency
           await this.legacyStorage.deleteMemory(id);
@@ -147,29 +428,45 @@ class UnifiedMemoryStorage {
     return '1';
   }
 
+  // Fixed-shape frontmatter written directly; tags are JSON strings so quotes
+  // and commas inside a tag survive the round trip
   generateMarkdownContent(memory) {
-    const frontmatter = [
-      '---',
-      `id: ${memory.id}`,
-      `timestamp: ${memory.timestamp}`,
-      `complexity: ${memory.complexity}`,
-      `category: ${memory.category}`,
-      `project: ${memory.project}`,
-      memory.tags && memory.tags.length > 0 ? `tags: [${memory.tags.map(t => `"${t}"`).join(', ')}]` : '',
-      memory.priority ? `priority: ${memory.priority}` : '',
-      '---'
-    ].filter(line => line !== '').join('\n');
+    const tags = memory.tags && memory.tags.length > 0
+      ? `tags: [${memory.tags.map(t => JSON.stringify(String(t))).join(', ')}]\n`
+      : '';
+    const priority = memory.priority ? `priority: ${memory.priority}\n` : '';
 
-    return `${frontmatter}\n${memory.content}`;
+    return '---\n' +
+      `id: ${memory.id}\n` +
+      `timestamp: ${memory.timestamp}\n` +
+      `complexity: ${memory.complexity}\n` +
+      `category: ${memory.category}\n` +
+      `project: ${memory.project}\n` +
+      tags +
+      priority +
+      `---\n${memory.content}`;
   }
 
   parseMarkdownMemory(content, filepath) {
     try {
-      const [frontmatterSection, ...contentParts] = content.split('---').slice(1);
-      if (!frontmatterSection) return null;
+      const sections = MemoryFormat.splitFrontmatter(content);
+      if (!sections) return null;
+      const { frontmatter, body } = sections;
 
-      const memory = { filepath };
-      const lines = frontmatterSection.trim().split('\n');
+      // Declare every field up front so all parsed memories share one
+      // object shape regardless of the key order in the file
+      const memory = {
+        filepath,
+        id: undefined,
+        timestamp: undefined,
+        complexity: undefined,
+        category: undefined,
+        project: undefined,
+        priority: undefined,
+        tags: undefined,
+        content: undefined
+      };
+      const lines = frontmatter.trim().split('\n');
       
       for (const line of lines) {
         const [key, ...valueParts] = line.split(':');
@@ -202,7 +499,7 @@ class UnifiedMemoryStorage {
         }
       }
       
-      memory.content = contentParts.join('---').trim();
+      memory.content = body.trim();
       return memory;
     } catch (error) {
       console.error('Error parsing memory:', error);
@@ -212,6 +509,15 @@ class UnifiedMemoryStorage {
 
   parseTags(tagString) {
     try {
+      if (tagString.startsWith('["') && tagString.endsWith(']')) {
+        // Written by generateMarkdownContent: a JSON array of strings
+        try {
+          const parsed = JSON.parse(tagString);
+          if (Array.isArray(parsed)) return parsed.map(String).filter(t => t.length > 0);
+        } catch {
+          // Hand-edited list - fall through to the lenient split below
+        }
+      }
       if (tagString.startsWith('[') && tagString.endsWith(']')) {
         return tagString.slice(1, -1)
           .split(',')
@@ -241,6 +547,8 @@ class UnifiedTaskStorage {
       createBackups: true
     });
     this.initialized = false;
+    this.taskProjects = new Map(); // task id -> project directory, filled as tasks.json files are read
+    this.taskFileCache = new Map(); // project -> { mtimeMs, size, tasks } parsed from its tasks.json
   }
 
   async initialize() {
@@ -277,6 +585,8 @@ class UnifiedTaskStorage {
     // Add new task
     tasks.push(task);
     await this.unifiedStorage.writeFile(filename, JSON.stringify(tasks, null, 2));
+    this.taskFileCache.delete(task.project);
+    this.taskProjects.set(task.id, task.project);
     
     // UNIFIED STORAGE ONLY - No legacy fallback to prevent fragmentation
     console.log(`📁 [UNIFIED] Task saved to: ${this.unifiedStorage.unifiedPath}/${filename}`);
@@ -296,22 +606,29 @@ class UnifiedTaskStorage {
 
     try {
       if (await this.unifiedStorage.exists('tasks')) {
+        // Dirents skip stray files without a stat; symlinks are left for
+        // loadProjectTasks to resolve
         const projects = filters.project 
           ? [filters.project] 
-          : await fs.readdir(tasksPath);
+          : (await fs.readdir(tasksPath, { withFileTypes: true }))
+              .filter(entry => entry.isDirectory() || entry.isSymbolicLink())
+              .map(entry => entry.name);
 
-        for (const project of projects) {
-          const projectPath = this.unifiedStorage.join(tasksPath, project);
-          const tasksFile = this.unifiedStorage.join(projectPath, 'tasks.json');
-          
-          if (await fs.pathExists(tasksFile)) {
-            const tasks = JSON.parse(await fs.readFile(tasksFile, 'utf8'));
-            allTasks.push(...tasks.filter(task => {
-              if (filters.status && task.status !== filters.status) return false;
-              if (filters.priority && task.priority !== filters.priority) return false;
-              return true;
-            }));
-          }
+        // Project files are stat'ed/read in parallel batches; results keep readdir order
+        for (let i = 0; i < projects.length; i += INDEX_READ_CONCURRENCY) {
+          const batch = projects.slice(i, i + INDEX_READ_CONCURRENCY);
+          const loaded = await Promise.all(batch.map(project =>
+            this.loadProjectTasks(project, this.unifiedStorage.join(tasksPath, project, 'tasks.json'))));
+
+          batch.forEach((project, j) => {
+            for (const task of loaded[j] || []) {
+              this.taskProjects.set(task.id, project);
+              if (filters.status && task.status !== filters.status) continue;
+              if (filters.priority && task.priority !== filters.priority) continue;
+              // Copy so callers cannot modify the cached parse
+              allTasks.push({ ...task });
+            }
+          });
         }
       }
     } catch (error) {
@@ -323,31 +640,66 @@ class UnifiedTaskStorage {
     return allTasks.sort((a, b) => new Date(b.created) - new Date(a.created));
   }
 
+  /**
+   * Parsed tasks.json of a project, or null if it has none. The file is only
+   * re-read and re-parsed when its mtime or size changed since the last call.
+   */
+  async loadProjectTasks(project, tasksFile) {
+    let stat;
+    try {
+      stat = await fs.stat(tasksFile);
+    } catch {
+      this.taskFileCache.delete(project);
+      return null;
+    }
+
+    const cached = this.taskFileCache.get(project);
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      return cached.tasks;
+    }
+
+    const tasks = JSON.parse(await fs.readFile(tasksFile, 'utf8'));
+    this.taskFileCache.set(project, { mtimeMs: stat.mtimeMs, size: stat.size, tasks });
+    return tasks;
+  }
+
+  /**
+   * Find the project file holding a task. Known ids read only their own
+   * project's tasks.json; unknown or moved ids trigger one full listing,
+   * which refreshes the id -> project map.
+   */
+  async locateTask(id) {
+    for (let attempt = 0; attempt < 2; attempt++) {
+      const project = this.taskProjects.get(id);
+      if (project !== undefined) {
+        const filename = `tasks/${project}/tasks.json`;
+        if (await this.unifiedStorage.exists(filename)) {
+          const tasks = JSON.parse(await this.unifiedStorage.readFile(filename));
+          const index = tasks.findIndex(t => t.id === id);
+          if (index >= 0) return { project, filename, tasks, index };
+        }
+        this.taskProjects.delete(id);
+      }
+      if (attempt === 0) await this.listTasks();
+    }
+    return null;
+  }
+
   async updateTask(id, updates) {
     await this.initialize();
     
     try {
-      // Find the task across all projects
-      const allTasks = await this.listTasks();
-      const task = allTasks.find(t => t.id === id);
-      
-      if (!task) {
+      const location = await this.locateTask(id);
+      if (!location) {
         throw new Error(`Task ${id} not found`);
       }
 
-      // Update the task
-      const updatedTask = { ...task, ...updates, updated: new Date().toISOString() };
-      
-      // Save back to unified storage
-      const filename = `tasks/${task.project}/tasks.json`;
-      const existingContent = await this.unifiedStorage.readFile(filename);
-      const tasks = JSON.parse(existingContent);
-      
-      const taskIndex = tasks.findIndex(t => t.id === id);
-      if (taskIndex >= 0) {
-        tasks[taskIndex] = updatedTask;
-        await this.unifiedStorage.writeFile(filename, JSON.stringify(tasks, null, 2));
-      }
+      // Update the task and save it back to its project file
+      const { project, filename, tasks, index } = location;
+      const updatedTask = { ...tasks[index], ...updates, updated: new Date().toISOString() };
+      tasks[index] = updatedTask;
+      await this.unifiedStorage.writeFile(filename, JSON.stringify(tasks, null, 2));
+      this.taskFileCache.delete(project);
 
       // Also update legacy storage
       await this.legacyStorage.updateTask(id, updates);
@@ -366,6 +718,34 @@ class UnifiedTaskStorage {
     }
   }
 
+  async deleteTask(id) {
+    await this.initialize();
+
+    try {
+      const location = await this.locateTask(id);
+      if (!location) {
+        throw new Error(`Task ${id} not found`);
+      }
+
+      const { project, filename, tasks, index } = location;
+      const [deletedTask] = tasks.splice(index, 1);
+      await this.unifiedStorage.writeFile(filename, JSON.stringify(tasks, null, 2));
+      this.taskFileCache.delete(project);
+      this.taskProjects.delete(id);
+
+      return {
+        success: true,
+        message: `✅ Task deleted: ${deletedTask.title}`
+      };
+    } catch (error) {
+      console.error('Error deleting task:', error);
+      return {
+        success: false,
+        message: `❌ Failed to delete task: ${error.message}`
+      };
+    }
+  }
+
   async getAllTasks() {
     // Simple wrapper for getAllTasks that calls listTasks with no filters
     return await this.listTasks();
@@ -458,9 +838,7 @@ class LegacyMemoryStorage {
       
       const projects = filters.project 
         ? [filters.project] 
-        : fs.readdirSync(this.baseDir).filter(p => 
-            fs.statSync(path.join(this.baseDir, p)).isDirectory()
-          );
+        : listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const projectPath = path.join(this.baseDir, project);
@@ -487,11 +865,12 @@ class LegacyMemoryStorage {
 
   parseMarkdownMemory(content, filepath) {
     try {
-      const [frontmatterSection, ...contentParts] = content.split('---').slice(1);
-      if (!frontmatterSection) return null;
+      const sections = MemoryFormat.splitFrontmatter(content);
+      if (!sections) return null;
+      const { frontmatter, body } = sections;
 
       const memory = { filepath };
-      const lines = frontmatterSection.trim().split('\n');
+      const lines = frontmatter.trim().split('\n');
       
       for (const line of lines) {
         const [key, ...valueParts] = line.split(':');
@@ -510,7 +889,7 @@ class LegacyMemoryStorage {
         }
       }
       
-      memory.content = contentParts.join('---').trim();
+      memory.content = body.trim();
       return memory;
     } catch (error) {
       return null;
@@ -554,9 +933,11 @@ class LegacyMemoryStorage {
 
   async searchMemories(query) {
     const allMemories = await this.listMemories();
+    // One case-insensitive pattern instead of lowercasing every field per memory
+    const pattern = new RegExp(escapeRegExp(query), 'i');
     return allMemories.filter(memory =>
-      memory.content.toLowerCase().includes(query.toLowerCase()) ||
-      (memory.tags && memory.tags.some(tag => tag.toLowerCase().includes(query.toLowerCase())))
+      pattern.test(memory.content) ||
+      (memory.tags && memory.tags.some(tag => pattern.test(tag)))
     );
   }
 }
@@ -622,9 +1003,7 @@ class LegacyTaskStorage {
     try {
       const projects = filters.project 
         ? [filters.project] 
-        : fs.readdirSync(this.baseDir).filter(p => 
-            fs.statSync(path.join(this.baseDir, p)).isDirectory()
-          );
+        : listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const tasksFile = path.join(this.baseDir, project, 'tasks.json');
@@ -27,6 +27,7 @@ class UnifiedStorage {
         this.unifiedPath = this.getUnifiedStoragePath();
         this.legacyPaths = this.getLegacyStoragePaths();
         this.initialized = false;
+        this.knownDirs = new Set(); // Directories already ensured, to skip mkdir per write
         
         // Configuration
         this.config = {
@@ -215,6 +216,7 @@ class UnifiedStorage {
     async ensureDirectory(dirPath) {
         try {
             await fs.ensureDir(dirPath);
+            this.knownDirs.add(dirPath);
             console.log(`📁 Directory ensured: ${dirPath}`);
         } catch (error) {
             console.error(`❌ Failed to create directory ${dirPath}: ${error.message}`);
@@ -233,21 +235,43 @@ class UnifiedStorage {
         const filePath = this.join(this.unifiedPath, filename);
         
         try {
-            // Ensure directory exists
-            await fs.ensureDir(path.dirname(filePath));
+            // Ensure directory exists (once per directory per process)
+            const dirPath = path.dirname(filePath);
+            if (!this.knownDirs.has(dirPath)) {
+                await fs.ensureDir(dirPath);
+                this.knownDirs.add(dirPath);
+            }
             
-            // Create backup if file exists and backups are enabled
-            if (this.config.createBackups && await fs.pathExists(filePath)) {
-                const backupPath = this.join(this.unifiedPath, 'backups', `${path.basename(filename)}.backup.${Date.now()}`);
-                await fs.copy(filePath, backupPath);
+            // Create backup if file exists and backups are enabled.
+            // Copy straight away - a new file just fails with ENOENT, which
+            // saves the existence check on every first write.
+            if (this.config.createBackups) {
+                const backupDir = this.join(this.unifiedPath, 'backups');
+                if (!this.knownDirs.has(backupDir)) {
+                    await fs.ensureDir(backupDir);
+                    this.knownDirs.add(backupDir);
+                }
+                const backupPath = this.join(backupDir, `${path.basename(filename)}.backup.${Date.now()}`);
+                try {
+                    await fs.copyFile(filePath, backupPath);
+                } catch (error) {
+                    if (error.code !== 'ENOENT') throw error;
+                }
             }
 
-            // Normalize line endings
-            const normalizedData = typeof data === 'string' 
+            // Normalize line endings (skip the copy when there are none)
+            const normalizedData = typeof data === 'string' && data.includes('\r\n')
                 ? data.replace(/\r\n/g, '\n') 
                 : data;
 
-            await fs.writeFile(filePath, normalizedData, 'utf8');
+            try {
+                await fs.writeFile(filePath, normalizedData, 'utf8');
+            } catch (error) {
+                // The cached directory may have been removed behind our back
+                if (error.code !== 'ENOENT') throw error;
+                await fs.ensureDir(dirPath);
+                await fs.writeFile(filePath, normalizedData, 'utf8');
+            }
             console.log(`💾 File written: ${filePath}`);
             return filePath;
         } catch (error) {
@@ -65,15 +65,20 @@ export default {
           now - new Date(t.created).getTime() < periodMs
         );
         
+        // Count every breakdown in one pass per collection; the task rates
+        // below are read off the status counts rather than re-filtered
+        const memoryCounts = this.countByKeys(recentMemories, ['category', 'complexity', 'project']);
+        const taskCounts = this.countByKeys(recentTasks, ['status', 'priority', 'project']);
+        
         // Calculate analytics
         const analytics = {
           period,
           timestamp: new Date().toISOString(),
           memories: {
             total: recentMemories.length,
-            by_category: this.groupBy(recentMemories, 'category'),
-            by_complexity: this.groupBy(recentMemories, 'complexity'),
-            by_project: this.groupBy(recentMemories, 'project'),
+            by_category: memoryCounts.category,
+            by_complexity: memoryCounts.complexity,
+            by_project: memoryCounts.project,
             recent: recentMemories.slice(0, 5).map(m => ({
               id: m.id,
               timestamp: m.timestamp,
@@ -83,12 +88,14 @@ export default {
           },
           tasks: {
             total: recentTasks.length,
-            by_status: this.groupBy(recentTasks, 'status'),
-            by_priority: this.groupBy(recentTasks, 'priority'),
-            by_project: this.groupBy(recentTasks, 'project'),
-            completion_rate: this.calculateCompletionRate(recentTasks),
-            active: recentTasks.filter(t => t.status === 'in_progress').length,
-            blocked: recentTasks.filter(t => t.status === 'blocked').length
+            by_status: taskCounts.status,
+            by_priority: taskCounts.priority,
+            by_project: taskCounts.project,
+            completion_rate: recentTasks.length > 0
+              ? Math.round(((taskCounts.status.done || 0) / recentTasks.length) * 100)
+              : 0,
+            active: taskCounts.status.in_progress || 0,
+            blocked: taskCounts.status.blocked || 0
           }
         };
         
@@ -344,12 +351,18 @@ export default {
 
   // Helper methods
   groupBy(items, key) {
-    const grouped = {};
-    items.forEach(item => {
-      const value = item[key] || 'unknown';
-      grouped[value] = (grouped[value] || 0) + 1;
-    });
-    return grouped;
+    return this.countByKeys(items, [key])[key];
+  },
+
+  countByKeys(items, keys) {
+    const counts = Object.fromEntries(keys.map(key => [key, {}]));
+    for (const item of items) {
+      for (const key of keys) {
+        const value = item[key] || 'unknown';
+        counts[key][value] = (counts[key][value] || 0) + 1;
+      }
+    }
+    return counts;
   },
 
   calculateCompletionRate(tasks) {
@@ -79,6 +79,10 @@ export default {
             minComplexity: { 
               type: 'number',
               description: 'Minimum complexity level'
+            },
+            limit: {
+              type: 'number',
+              description: 'Maximum number of memories to return (newest first)'
             }
           }
         }
@@ -3,7 +3,7 @@
 # Create Release Package for Like-I-Said MCP Server v2
 # This script builds and packages the dashboard for release
 
-set -e
+set -eo pipefail
 
 echo "🚀 Creating Like-I-Said v2.6.8 Release Package"
 echo "============================================"
@@ -12,6 +12,11 @@ echo "============================================"
 VERSION=$(node -p "require('./package.json').version")
 RELEASE_NAME="like-i-said-v${VERSION}"
 RELEASE_DIR="releases/${RELEASE_NAME}"
+# zip compression level (0 = store only, 9 = smallest). Defaults to zip's own
+# level 6 for published archives; set ZIP_LEVEL=1 for a faster local build.
+ZIP_LEVEL="${ZIP_LEVEL:-6}"
+# gzip level for the tar.gz (1-9); 6 matches what tar -z used before
+GZIP_LEVEL="${GZIP_LEVEL:-6}"
 
 # Clean up any previous release
 rm -rf releases
@@ -105,10 +110,10 @@ EOF
 
 echo "📦 Creating ZIP archive..."
 cd releases
-zip -r ${RELEASE_NAME}.zip ${RELEASE_NAME}
+zip -r -${ZIP_LEVEL} ${RELEASE_NAME}.zip ${RELEASE_NAME}
 
 # Create tar.gz for Unix users
-tar -czf ${RELEASE_NAME}.tar.gz ${RELEASE_NAME}
+tar -cf - ${RELEASE_NAME} | gzip -${GZIP_LEVEL} > ${RELEASE_NAME}.tar.gz
 
 # Calculate checksums
 echo "🔐 Calculating checksums..."
@@ -0,0 +1,28 @@
+#!/usr/bin/env node
+
+import { UnifiedMemoryStorage } from '../../lib/unified-storage-adapter.js';
+
+/**
+ * Memory Index Snapshot Builder
+ * Parses every memory once and writes memory-index.json next to the
+ * memories folder. On startup the storage seeds its index from the snapshot
+ * and only re-parses files whose mtime changed, which makes cold starts of
+ * large or read-mostly stores much cheaper.
+ */
+
+async function buildSnapshot() {
+    console.log('🔄 Building memory index snapshot...');
+
+    try {
+        const storage = new UnifiedMemoryStorage();
+        const { path: snapshotPath, count } = await storage.saveIndexSnapshot();
+
+        console.log(`\n✅ Indexed ${count} memories`);
+        console.log(`💾 Snapshot: ${snapshotPath}`);
+    } catch (error) {
+        console.error('\n❌ Failed to build index snapshot:', error.message);
+        process.exit(1);
+    }
+}
+
+buildSnapshot();
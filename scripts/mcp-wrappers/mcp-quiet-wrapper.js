@@ -6,60 +6,64 @@
 import { spawn } from 'child_process';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
+import { tmpdir } from 'os';
 import { Transform } from 'stream';
+import { StringDecoder } from 'string_decoder';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+// Larger chunks mean fewer transform calls and writes for big tool payloads
+const FILTER_HIGH_WATER_MARK = 256 * 1024;
+
 // Create a transform stream that filters output
 class JSONRPCFilter extends Transform {
   constructor(options) {
-    super(options);
+    super({ highWaterMark: FILTER_HIGH_WATER_MARK, ...options });
     this.buffer = '';
+    // Keeps multi-byte characters intact when they straddle two chunks
+    this.decoder = new StringDecoder('utf8');
+  }
+
+  // Returns the line plus a newline if it is a JSON-RPC 2.0 message, else ''
+  filterLine(line) {
+    const trimmed = line.trim();
+    
+    // Only allow valid JSON-RPC messages through
+    if (trimmed.startsWith('{') && trimmed.includes('"jsonrpc"')) {
+      try {
+        const parsed = JSON.parse(trimmed);
+        if (parsed.jsonrpc === '2.0') {
+          return trimmed + '\n';
+        }
+      } catch (e) {
+        // Not valid JSON, suppress it
+      }
+    }
+    return '';
   }
 
   _transform(chunk, encoding, callback) {
-    this.buffer += chunk.toString();
+    this.buffer += this.decoder.write(chunk);
     
     // Process complete lines
     const lines = this.buffer.split('\n');
     this.buffer = lines.pop() || ''; // Keep incomplete line in buffer
     
+    // Forward everything that passed in a single write
+    let output = '';
     for (const line of lines) {
-      const trimmed = line.trim();
-      if (!trimmed) continue;
-      
-      // Only allow valid JSON-RPC messages through
-      if (trimmed.startsWith('{') && trimmed.includes('"jsonrpc"')) {
-        try {
-          const parsed = JSON.parse(trimmed);
-          if (parsed.jsonrpc === '2.0') {
-            this.push(trimmed + '\n');
-          }
-        } catch (e) {
-          // Not valid JSON, suppress it
-        }
-      }
+      output += this.filterLine(line);
     }
+    if (output) this.push(output);
     
     callback();
   }
 
   _flush(callback) {
     // Process any remaining data
-    if (this.buffer.trim()) {
-      const trimmed = this.buffer.trim();
-      if (trimmed.startsWith('{') && trimmed.includes('"jsonrpc"')) {
-        try {
-          const parsed = JSON.parse(trimmed);
-          if (parsed.jsonrpc === '2.0') {
-            this.push(trimmed + '\n');
-          }
-        } catch (e) {
-          // Not valid JSON, suppress it
-        }
-      }
-    }
+    const output = this.filterLine(this.buffer + this.decoder.end());
+    if (output) this.push(output);
     callback();
   }
 }
@@ -72,7 +76,9 @@ const env = {
   MCP_QUIET: 'true',
   NO_COLOR: '1',
   FORCE_COLOR: '0',
-  NODE_NO_WARNINGS: '1'
+  NODE_NO_WARNINGS: '1',
+  // Node 22.1+ caches compiled code here so restarts skip re-parsing
+  NODE_COMPILE_CACHE: process.env.NODE_COMPILE_CACHE || join(tmpdir(), 'like-i-said-compile-cache')
 };
 
 const child = spawn('node', [serverPath], {
@@ -17,7 +17,9 @@
  */
 
 import fs from 'fs';
+import os from 'os';
 import path from 'path';
+import module from 'module';
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import express from 'express';
@@ -30,10 +32,18 @@ import {
 } from '@modelcontextprotocol/sdk/types.js';
 import { fileURLToPath } from 'url';
 import { formatTasksForTerminal } from './lib/terminal-formatter.js';
+import { listSubdirectories } from './lib/fs-utils.js';
+import { withArgumentValidation } from './lib/tool-argument-validator.js';
 import { UnifiedMemoryStorage, UnifiedTaskStorage } from './lib/unified-storage-adapter.js';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
+// Keep V8's compiled code on disk (Node 22.1+; a no-op on older versions) so
+// restarts skip re-parsing lazily imported plugins. Child processes get the
+// same directory through NODE_COMPILE_CACHE.
+const COMPILE_CACHE_DIR = process.env.NODE_COMPILE_CACHE || path.join(os.tmpdir(), 'like-i-said-compile-cache');
+module.enableCompileCache?.(COMPILE_CACHE_DIR);
+
 // Configuration
 const CONFIG = {
   mode: process.env.MCP_MODE || 'minimal', // minimal, ai, full
@@ -157,15 +167,15 @@ priority: ${memory.priority}
     try {
       const projects = filters.project 
         ? [filters.project] 
-        : fs.readdirSync(this.baseDir).filter(p => 
-            fs.statSync(path.join(this.baseDir, p)).isDirectory()
-          );
+        : listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const projectDir = path.join(this.baseDir, project);
         if (!fs.existsSync(projectDir)) continue;
 
-        const files = fs.readdirSync(projectDir).filter(f => f.endsWith('.md'));
+        const files = fs.readdirSync(projectDir, { withFileTypes: true })
+          .filter(entry => entry.name.endsWith('.md') && !entry.isDirectory())
+          .map(entry => entry.name);
         
         for (const file of files) {
           const filepath = path.join(projectDir, file);
@@ -287,9 +297,7 @@ class MinimalTaskStorage {
     try {
       const projects = filters.project 
         ? [filters.project] 
-        : fs.readdirSync(this.baseDir).filter(p => 
-            fs.statSync(path.join(this.baseDir, p)).isDirectory()
-          );
+        : listSubdirectories(this.baseDir);
 
       for (const project of projects) {
         const tasksFile = path.join(this.baseDir, project, 'tasks.json');
@@ -397,6 +405,8 @@ class PluginManager {
     this.logger = logger;
     this.plugins = new Map();
     this.loadedPlugins = new Map();
+    this.toolsCache = null; // Rebuilt after a plugin is loaded
+    this.toolOwners = new Map(); // tool name -> plugin that handles it
   }
 
   async loadPlugin(pluginPath) {
@@ -413,6 +423,7 @@ class PluginManager {
       
       this.plugins.set(instance.name, instance);
       this.loadedPlugins.set(instance.name, plugin);
+      this.toolsCache = null;
       
       this.logger.info(`Plugin loaded: ${instance.name} v${instance.version}`);
       return instance;
@@ -431,30 +442,37 @@ class PluginManager {
   }
 
   async getAllTools() {
+    if (this.toolsCache) return this.toolsCache;
+
     const allTools = [];
+    const toolOwners = new Map();
     
     for (const plugin of this.plugins.values()) {
       if (plugin.getTools) {
         try {
           const tools = plugin.getTools();
           allTools.push(...tools);
+          if (plugin.handleTool) {
+            for (const tool of tools) {
+              if (!toolOwners.has(tool.name)) toolOwners.set(tool.name, plugin);
+            }
+          }
         } catch (error) {
           this.logger.warn(`Error getting tools from ${plugin.name}:`, error.message);
         }
       }
     }
     
+    this.toolOwners = toolOwners;
+    this.toolsCache = allTools;
     return allTools;
   }
 
   async handlePluginTool(toolName, args) {
-    for (const plugin of this.plugins.values()) {
-      if (plugin.handleTool) {
-        const tools = plugin.getTools ? plugin.getTools() : [];
-        if (tools.some(t => t.name === toolName)) {
-          return await plugin.handleTool(toolName, args);
-        }
-      }
+    await this.getAllTools();
+    const plugin = this.toolOwners.get(toolName);
+    if (plugin) {
+      return await plugin.handleTool(toolName, args);
     }
     
     throw new Error(`No plugin found to handle tool: ${toolName}`);
@@ -469,7 +487,7 @@ async function startDashboard(port, logger) {
   
   // Start dashboard server bridge as child process
   const dashboardProcess = spawn('node', ['dashboard-server-bridge.js'], {
-    env: { ...process.env, PORT: port.toString() },
+    env: { ...process.env, PORT: port.toString(), NODE_COMPILE_CACHE: COMPILE_CACHE_DIR },
     stdio: 'pipe'
   });
   
@@ -580,7 +598,8 @@ async function startUnifiedServer() {
         properties: {
           project: { type: 'string' },
           category: { type: 'string' },
-          minComplexity: { type: 'number' }
+          minComplexity: { type: 'number' },
+          limit: { type: 'number' }
         }
       }
     },
@@ -590,7 +609,8 @@ async function startUnifiedServer() {
       inputSchema: {
         type: 'object',
         properties: {
-          query: { type: 'string' }
+          query: { type: 'string' },
+          limit: { type: 'number' }
         },
         required: ['query']
       }
@@ -720,94 +740,82 @@ async function startUnifiedServer() {
     }
   );
 
-  // Register tools list handler
+  // Register tools list handler. The tool set only changes when a plugin is
+  // loaded, so the response is built once and shared until then.
+  let toolsListResult = null;
+  let toolsListPluginTools = null;
   server.setRequestHandler(ListToolsRequestSchema, async () => {
     const pluginTools = await pluginManager.getAllTools();
-    const allTools = [
-      ...coreMemoryTools,
-      ...coreTaskTools,
-      testTool,
-      ...pluginTools
-    ];
-
-    return { tools: allTools };
+    if (pluginTools !== toolsListPluginTools) {
+      toolsListResult = {
+        tools: [
+          ...coreMemoryTools,
+          ...coreTaskTools,
+          testTool,
+          ...pluginTools
+        ]
+      };
+      toolsListPluginTools = pluginTools;
+    }
+
+    return toolsListResult;
   });
 
+  // Core tool handlers, looked up by name instead of walking a switch.
+  // Arguments are checked against each tool's inputSchema before the call.
+  const coreToolHandlers = withArgumentValidation([...coreMemoryTools, ...coreTaskTools, testTool], new Map([
+    // Memory tools
+    ['add_memory', args => memoryStorage.addMemory(args.content, args.project, args.category, args.tags, args.priority)],
+    ['list_memories', args => memoryStorage.listMemories(args)],
+    ['search_memories', args => memoryStorage.searchMemories(args.query, { limit: args.limit })],
+    ['get_memory', args => memoryStorage.getMemory(args.id)],
+    ['delete_memory', args => memoryStorage.deleteMemory(args.id)],
+
+    // Task tools
+    ['create_task', args => taskStorage.createTask(args)],
+    ['update_task', args => taskStorage.updateTask(args.id, args)],
+    ['list_tasks', async args => {
+      // Get raw task data
+      const taskData = await taskStorage.listTasks(args);
+      
+      // Handle terminal formatting
+      if (args.format === 'terminal') {
+        const formattingOptions = {
+          filter: args.filter || (args.status === 'active' ? 'active' : args.status),
+          showProject: true,
+          showId: true,
+          showSummary: true
+        };
+        
+        // If taskData is an object with tasks array, extract tasks
+        const tasks = Array.isArray(taskData) ? taskData : (taskData.tasks || []);
+        return formatTasksForTerminal(tasks, formattingOptions);
+      }
+      return taskData;
+    }],
+    ['get_task_context', args => taskStorage.getTaskContext(args.id, args.depth)],
+    ['delete_task', args => taskStorage.deleteTask(args.id)],
+
+    // Test tool
+    ['test_tool', args => ({
+      success: true,
+      message: `✅ Like-I-Said Unified MCP Server is working! Mode: ${CONFIG.mode}, Message: ${args.message || 'No message'}`,
+      timestamp: new Date().toISOString(),
+      mode: CONFIG.mode,
+      plugins_loaded: pluginManager.getAllPlugins().map(p => `${p.name} v${p.version}`)
+    })]
+  ]));
+
   // Register tool call handler
   server.setRequestHandler(CallToolRequestSchema, async (request) => {
-    const { name, arguments: args } = request.params;
+    const { name, arguments: args = {} } = request.params;
 
     try {
-      let result;
-
-      // Handle core tools
-      switch (name) {
-        // Memory tools
-        case 'add_memory':
-          result = await memoryStorage.addMemory(args.content, args.project, args.category, args.tags, args.priority);
-          break;
-        case 'list_memories':
-          result = await memoryStorage.listMemories(args);
-          break;
-        case 'search_memories':
-          result = await memoryStorage.searchMemories(args.query);
-          break;
-        case 'get_memory':
-          result = await memoryStorage.getMemory(args.id);
-          break;
-        case 'delete_memory':
-          result = await memoryStorage.deleteMemory(args.id);
-          break;
-
-        // Task tools
-        case 'create_task':
-          result = await taskStorage.createTask(args);
-          break;
-        case 'update_task':
-          result = await taskStorage.updateTask(args.id, args);
-          break;
-        case 'list_tasks':
-          // Get raw task data
-          const taskData = await taskStorage.listTasks(args);
-          
-          // Handle terminal formatting
-          if (args.format === 'terminal') {
-            const formattingOptions = {
-              filter: args.filter || (args.status === 'active' ? 'active' : args.status),
-              showProject: true,
-              showId: true,
-              showSummary: true
-            };
-            
-            // If taskData is an object with tasks array, extract tasks
-            const tasks = Array.isArray(taskData) ? taskData : (taskData.tasks || []);
-            result = formatTasksForTerminal(tasks, formattingOptions);
-          } else {
-            result = taskData;
-          }
-          break;
-        case 'get_task_context':
-          result = await taskStorage.getTaskContext(args.id, args.depth);
-          break;
-        case 'delete_task':
-          result = await taskStorage.deleteTask(args.id);
-          break;
-
-        // Test tool
-        case 'test_tool':
-          result = {
-            success: true,
-            message: `✅ Like-I-Said Unified MCP Server is working! Mode: ${CONFIG.mode}, Message: ${args.message || 'No message'}`,
-            timestamp: new Date().toISOString(),
-            mode: CONFIG.mode,
-            plugins_loaded: pluginManager.getAllPlugins().map(p => `${p.name} v${p.version}`)
-          };
-          break;
-
-        default:
-          // Try to handle with plugins
-          result = await pluginManager.handlePluginTool(name, args);
-      }
+      // Handle core tools, otherwise try the plugins
+      const coreHandler = coreToolHandlers.get(name);
+      const result = coreHandler
+        ? await coreHandler(args)
+        : await pluginManager.handlePluginTool(name, args);
 
       return {
         content: [
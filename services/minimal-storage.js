@@ -5,10 +5,26 @@
 
 import fs from 'fs';
 import path from 'path';
+import { MemoryFormat } from '../lib/memory-format.js';
+import { escapeRegExp } from '../lib/regex-utils.js';
 
 export class MinimalStorage {
+  static FIELD_REGEX = /^([^:\n]*):([^\n]*)$/gm;
+  static NESTED_FIELD_REGEX = /\n[ \t]/;
+  static JSON_ESCAPED_CHARS = /["\\\u0000-\u001f]/;
+  static ISO_UTC_TIMESTAMP_REGEX = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$/;
+  static PLAIN_VALUE_REGEX = /^[^\s"'\[{](?:[^\r\n]*\S)?$/;
+  static CODE_KEYWORDS_REGEX = /code|function|class/i;
+  static TASK_KEYWORDS_REGEX = /task|todo/i;
+  static RESEARCH_KEYWORDS_REGEX = /research|analysis/i;
+  static SLUG_SEPARATOR_REGEX = /[^a-z0-9]+/g;
+
   constructor(baseDir = 'memories') {
     this.baseDir = baseDir;
+    this.indexPath = path.join(baseDir, '.index.json');
+    this.index = null; // filepath -> { id, project, category, complexity, mtimeMs }
+    this.memoryCache = new Map(); // filepath -> { mtimeMs, memory }
+    this.knownDirs = new Set(); // Project directories already created
     this.ensureDirectories();
   }
 
@@ -45,14 +61,29 @@ export class MinimalStorage {
     const filename = this.generateFilename(memory);
     const filepath = path.join(this.baseDir, memory.project, filename);
     
-    // Ensure project directory exists
+    // Ensure project directory exists (once per directory, not per save)
     const projectDir = path.join(this.baseDir, memory.project);
-    if (!fs.existsSync(projectDir)) {
+    if (!this.knownDirs.has(projectDir)) {
       fs.mkdirSync(projectDir, { recursive: true });
+      this.knownDirs.add(projectDir);
     }
 
     const markdownContent = this.formatMemory(memory);
-    fs.writeFileSync(filepath, markdownContent, 'utf8');
+    try {
+      fs.writeFileSync(filepath, markdownContent, 'utf8');
+    } catch (error) {
+      // Directory removed since it was first created
+      if (error.code !== 'ENOENT') throw error;
+      fs.mkdirSync(projectDir, { recursive: true });
+      fs.writeFileSync(filepath, markdownContent, 'utf8');
+    }
+
+    const { mtimeMs } = fs.statSync(filepath);
+    const saved = this.parseMemory(markdownContent, filepath);
+    this.memoryCache.set(filepath, { mtimeMs, memory: saved });
+    this.loadIndex();
+    this.indexMemory(saved, mtimeMs);
+    this.saveIndex();
     
     return memory;
   }
@@ -65,48 +96,70 @@ export class MinimalStorage {
     return 1;
   }
 
+  // Case-insensitive regexes stop at the first hit instead of lowercasing the whole content
   detectCategory(content) {
-    const lowerContent = content.toLowerCase();
-    if (lowerContent.includes('code') || lowerContent.includes('function') || lowerContent.includes('class')) {
+    if (MinimalStorage.CODE_KEYWORDS_REGEX.test(content)) {
       return 'code';
     }
-    if (lowerContent.includes('task') || lowerContent.includes('todo')) {
+    if (MinimalStorage.TASK_KEYWORDS_REGEX.test(content)) {
       return 'task';
     }
-    if (lowerContent.includes('research') || lowerContent.includes('analysis')) {
+    if (MinimalStorage.RESEARCH_KEYWORDS_REGEX.test(content)) {
       return 'research';
     }
     return 'general';
   }
 
   generateFilename(memory) {
-    const date = new Date(memory.timestamp);
-    const dateStr = date.toISOString().split('T')[0];
+    // Timestamps we generate are already ISO strings; only re-parse others
+    const dateStr = MinimalStorage.ISO_UTC_TIMESTAMP_REGEX.test(memory.timestamp)
+      ? memory.timestamp.slice(0, 10)
+      : new Date(memory.timestamp).toISOString().slice(0, 10);
     const title = (memory.title || memory.content.substring(0, 50))
       .toLowerCase()
-      .replace(/[^a-z0-9]+/g, '-')
+      .replace(MinimalStorage.SLUG_SEPARATOR_REGEX, '-')
       .substring(0, 30);
     return `${dateStr}-${title}-${memory.id}.md`;
   }
 
+  // Scalars that would not survive the line-based parser are written as JSON strings
+  formatValue(value) {
+    const text = String(value);
+    return MinimalStorage.PLAIN_VALUE_REGEX.test(text) ? text : JSON.stringify(text);
+  }
+
   formatMemory(memory) {
-    const frontmatter = [
-      '---',
-      `id: ${memory.id}`,
-      `timestamp: ${memory.timestamp}`,
-      `complexity: ${memory.complexity}`,
-      `category: ${memory.category}`,
-      memory.project ? `project: ${memory.project}` : null,
-      memory.tags?.length > 0 ? `tags: ${JSON.stringify(memory.tags)}` : 'tags: []',
-      '---',
-      ''
-    ].filter(line => line !== null).join('\n');
+    const project = memory.project ? `project: ${this.formatValue(memory.project)}\n` : '';
+    const tags = memory.tags?.length > 0 ? JSON.stringify(memory.tags) : '[]';
 
-    return frontmatter + (memory.content || '');
+    return '---\n' +
+      `id: ${this.formatValue(memory.id)}\n` +
+      `timestamp: ${memory.timestamp}\n` +
+      `complexity: ${memory.complexity}\n` +
+      `category: ${this.formatValue(memory.category)}\n` +
+      project +
+      `tags: ${tags}\n` +
+      '---\n' +
+      (memory.content || '');
   }
 
   async listMemories(filters = {}) {
+    return this.collectMemories({
+      skip: entry => !this.matchesFilters(entry, filters),
+      accept: memory => this.matchesFilters(memory, filters),
+      limit: filters.limit
+    });
+  }
+
+  // Walk every memory file and return the accepted ones newest first.
+  // Files whose indexed mtime is current can be skipped without a read, and
+  // prefilter() can reject raw text before it is parsed.
+  collectMemories({ skip, prefilter, accept, limit }) {
+    this.loadIndex();
     const memories = [];
+    const seen = new Set();
+    let indexChanged = false;
+
     const scanDir = (dir) => {
       if (!fs.existsSync(dir)) return;
       
@@ -118,10 +171,20 @@ export class MinimalStorage {
           scanDir(fullPath);
         } else if (entry.name.endsWith('.md')) {
           try {
-            const content = fs.readFileSync(fullPath, 'utf8');
-            const memory = this.parseMemory(content, fullPath);
-            if (memory && this.matchesFilters(memory, filters)) {
-              memories.push(memory);
+            seen.add(fullPath);
+            const { mtimeMs } = fs.statSync(fullPath);
+            const indexed = this.index.get(fullPath);
+            const fresh = indexed && indexed.mtimeMs === mtimeMs;
+            if (fresh && skip && skip(indexed)) continue;
+
+            const memory = this.readMemory(fullPath, mtimeMs, prefilter);
+            if (!memory) continue;
+            if (!fresh) {
+              this.indexMemory(memory, mtimeMs);
+              indexChanged = true;
+            }
+            if (accept(memory)) {
+              memories.push({ ...memory });
             }
           } catch (error) {
             console.error(`Error reading ${fullPath}: ${error.message}`);
@@ -131,27 +194,133 @@ export class MinimalStorage {
     };
 
     scanDir(this.baseDir);
-    return memories.sort((a, b) => 
-      new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime()
-    );
+
+    for (const filepath of this.index.keys()) {
+      if (!seen.has(filepath)) {
+        this.index.delete(filepath);
+        indexChanged = true;
+      }
+    }
+    if (indexChanged) this.saveIndex();
+    for (const filepath of this.memoryCache.keys()) {
+      if (!seen.has(filepath)) this.memoryCache.delete(filepath);
+    }
+
+    return this.sortNewestFirst(memories, limit);
+  }
+
+  // Parse each timestamp once instead of twice per comparison. Unparseable
+  // timestamps sort last. With a limit only the newest `limit` entries are
+  // kept (in a small sorted array) rather than sorting everything.
+  sortNewestFirst(memories, limit) {
+    const keyed = memories.map(memory => {
+      const time = new Date(memory.timestamp).getTime();
+      return { memory, time: Number.isNaN(time) ? -Infinity : time };
+    });
+
+    if (!(limit > 0) || limit >= keyed.length) {
+      keyed.sort((a, b) => (a.time === b.time ? 0 : b.time - a.time));
+      return keyed.map(entry => entry.memory);
+    }
+
+    const top = [];
+    for (const entry of keyed) {
+      if (top.length === limit && entry.time <= top[limit - 1].time) continue;
+
+      // Insert after entries with the same time so ties keep walk order
+      let low = 0;
+      let high = top.length;
+      while (low < high) {
+        const mid = (low + high) >> 1;
+        if (top[mid].time >= entry.time) low = mid + 1;
+        else high = mid;
+      }
+      top.splice(low, 0, entry);
+      if (top.length > limit) top.pop();
+    }
+    return top.map(entry => entry.memory);
+  }
+
+  // Parsed memories are reused until the file's mtime changes
+  readMemory(filepath, mtimeMs, prefilter) {
+    const cached = this.memoryCache.get(filepath);
+    if (cached && cached.mtimeMs === mtimeMs) return cached.memory;
+
+    const content = fs.readFileSync(filepath, 'utf8');
+    if (prefilter && !prefilter(content)) return null;
+
+    const memory = this.parseMemory(content, filepath);
+    if (memory) this.memoryCache.set(filepath, { mtimeMs, memory });
+    return memory;
+  }
+
+  // On disk the index is keyed relative to baseDir, so processes that spell
+  // baseDir differently (relative vs absolute) share the same entries
+  loadIndex() {
+    if (this.index) return;
+    try {
+      const stored = JSON.parse(fs.readFileSync(this.indexPath, 'utf8'));
+      this.index = new Map(Object.entries(stored)
+        .map(([relativePath, entry]) => [path.join(this.baseDir, relativePath), entry]));
+    } catch {
+      this.index = new Map();
+    }
+  }
+
+  // Written to a temp file and renamed, so a crash or a concurrent writer
+  // never leaves truncated JSON behind
+  saveIndex() {
+    const tempPath = `${this.indexPath}.${process.pid}.tmp`;
+    try {
+      const stored = {};
+      for (const [filepath, entry] of this.index) {
+        stored[path.relative(this.baseDir, filepath)] = entry;
+      }
+      fs.writeFileSync(tempPath, JSON.stringify(stored), 'utf8');
+      fs.renameSync(tempPath, this.indexPath);
+    } catch (error) {
+      console.error(`Could not write memory index: ${error.message}`);
+      fs.rmSync(tempPath, { force: true });
+    }
+  }
+
+  indexMemory(memory, mtimeMs) {
+    this.index.set(memory.filepath, {
+      id: memory.id,
+      project: memory.project,
+      category: memory.category,
+      complexity: memory.complexity,
+      mtimeMs
+    });
   }
 
   parseMemory(content, filepath) {
-    const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---\n([\s\S]*)$/);
-    if (!frontmatterMatch) return null;
+    const parts = MemoryFormat.splitFrontmatter(content);
+    if (!parts) return null;
 
-    const memory = { content: frontmatterMatch[2].trim() };
-    const frontmatter = frontmatterMatch[1];
-    
-    const lines = frontmatter.split('\n');
-    lines.forEach(line => {
-      const colonIndex = line.indexOf(':');
-      if (colonIndex === -1) return;
-      
-      const key = line.slice(0, colonIndex).trim();
-      const value = line.slice(colonIndex + 1).trim();
-      
-      if (key === 'tags' && value.startsWith('[')) {
+    // Flat key: value headers (everything this class writes) take the regex
+    // fast path; indented blocks such as the metadata: section written by
+    // the full storage need MemoryFormat's structured parser
+    if (MinimalStorage.NESTED_FIELD_REGEX.test(parts.frontmatter)) {
+      const memory = MemoryFormat.parseFrontmatter(parts.frontmatter, parts.body);
+      memory.complexity = memory.complexity || 1;
+      memory.filepath = filepath;
+      return memory;
+    }
+
+    const memory = { content: parts.body.trim() };
+
+    for (const [, rawKey, rawValue] of parts.frontmatter.matchAll(MinimalStorage.FIELD_REGEX)) {
+      const key = rawKey.trim();
+      const value = rawValue.trim();
+
+      if (value.startsWith('"')) {
+        try {
+          memory[key] = JSON.parse(value);
+        } catch {
+          memory[key] = value;
+        }
+      } else if (key === 'tags' && value.startsWith('[')) {
         try {
           memory[key] = JSON.parse(value);
         } catch {
@@ -162,7 +331,7 @@ export class MinimalStorage {
       } else {
         memory[key] = value;
       }
-    });
+    }
 
     memory.filepath = filepath;
     return memory;
@@ -176,24 +345,49 @@ export class MinimalStorage {
   }
 
   async searchMemories(query) {
-    const allMemories = await this.listMemories();
-    const queryLower = query.toLowerCase();
-    
-    return allMemories.filter(memory => 
-      memory.content.toLowerCase().includes(queryLower) ||
-      memory.tags?.some(tag => tag.toLowerCase().includes(queryLower))
-    );
+    const pattern = new RegExp(escapeRegExp(query), 'i');
+    // Tags are stored JSON-encoded, so the raw file can only be used to
+    // reject non-matches when the query has nothing JSON would escape
+    const canPrefilter = !MinimalStorage.JSON_ESCAPED_CHARS.test(query);
+
+    return this.collectMemories({
+      prefilter: canPrefilter ? content => pattern.test(content) : null,
+      accept: memory => pattern.test(memory.content) || memory.tags?.some(tag => pattern.test(tag))
+    });
   }
 
   async getMemory(id) {
-    const memories = await this.listMemories();
-    return memories.find(m => m.id === id);
+    this.loadIndex();
+    for (const [filepath, entry] of this.index) {
+      if (entry.id !== id) continue;
+      try {
+        const { mtimeMs } = fs.statSync(filepath);
+        if (mtimeMs === entry.mtimeMs) {
+          const memory = this.readMemory(filepath, mtimeMs);
+          if (memory && memory.id === id) return { ...memory };
+        }
+      } catch {
+        // Stale entry - fall through to a full scan, which repairs the index
+      }
+      break;
+    }
+
+    // Only files the index cannot vouch for need reading; they get re-indexed
+    const [memory] = this.collectMemories({
+      skip: entry => entry.id !== id,
+      accept: candidate => candidate.id === id,
+      limit: 1
+    });
+    return memory;
   }
 
   async deleteMemory(id) {
     const memory = await this.getMemory(id);
     if (memory && memory.filepath) {
       fs.unlinkSync(memory.filepath);
+      this.index.delete(memory.filepath);
+      this.memoryCache.delete(memory.filepath);
+      this.saveIndex();
       return true;
     }
     return false;
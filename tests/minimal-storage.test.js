@@ -0,0 +1,79 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { MinimalStorage } from '../services/minimal-storage.js';
+
+describe('MinimalStorage', () => {
+  let baseDir;
+  let storage;
+
+  beforeEach(() => {
+    baseDir = fs.mkdtempSync(path.join(os.tmpdir(), 'lis-minimal-'));
+    storage = new MinimalStorage(baseDir);
+  });
+
+  afterEach(() => {
+    fs.rmSync(baseDir, { recursive: true, force: true });
+  });
+
+  test('round-trips values the line parser cannot read as plain text', async () => {
+    const saved = await storage.saveMemory('some notes', { category: 'multi\nline', tags: ['a', 'b'] });
+    const loaded = await storage.getMemory(saved.id);
+
+    expect(loaded.category).toBe('multi\nline');
+    expect(loaded.tags).toEqual(['a', 'b']);
+    expect(loaded.content).toBe('some notes');
+  });
+
+  test('searches content and tags case-insensitively', async () => {
+    await storage.saveMemory('has NEEDLE inside');
+    await storage.saveMemory('alpha beta', { tags: ['needle"tag'] });
+    await storage.saveMemory('nothing here');
+
+    expect(await storage.searchMemories('needle')).toHaveLength(2);
+    expect(await storage.searchMemories('needle"tag')).toHaveLength(1);
+    expect(await storage.searchMemories('a.b')).toHaveLength(0);
+  });
+
+  test('lists newest first and honours limit', async () => {
+    await storage.saveMemory('old', { timestamp: '2023-01-01T00:00:00.000Z' });
+    await storage.saveMemory('new', { timestamp: '2024-06-01T00:00:00.000Z' });
+    await storage.saveMemory('mid', { timestamp: '2023-09-01T00:00:00.000Z' });
+
+    expect((await storage.listMemories()).map(m => m.content)).toEqual(['new', 'mid', 'old']);
+    expect((await storage.listMemories({ limit: 2 })).map(m => m.content)).toEqual(['new', 'mid']);
+  });
+
+  test('keeps the sidecar index in step with the files', async () => {
+    const kept = await storage.saveMemory('kept', { project: 'one' });
+    const removed = await storage.saveMemory('removed', { project: 'two' });
+
+    const index = JSON.parse(fs.readFileSync(path.join(baseDir, '.index.json'), 'utf8'));
+    expect(Object.values(index).map(entry => entry.id).sort()).toEqual([kept.id, removed.id].sort());
+
+    expect(await storage.deleteMemory(removed.id)).toBe(true);
+    expect((await storage.listMemories({ project: 'one' })).map(m => m.id)).toEqual([kept.id]);
+    expect(await storage.listMemories({ project: 'two' })).toHaveLength(0);
+
+    const keptPath = storage.index.keys().next().value;
+    fs.writeFileSync(keptPath, fs.readFileSync(keptPath, 'utf8').replace('project: one', 'project: two'));
+    const later = new Date(Date.now() + 5000);
+    fs.utimesSync(keptPath, later, later);
+
+    expect((await storage.listMemories({ project: 'two' })).map(m => m.id)).toEqual([kept.id]);
+  });
+
+  test('stores index keys relative to the base directory', async () => {
+    const saved = await storage.saveMemory('portable', { project: 'one' });
+
+    const index = JSON.parse(fs.readFileSync(path.join(baseDir, '.index.json'), 'utf8'));
+    const { filepath } = await storage.getMemory(saved.id);
+    expect(Object.keys(index)).toEqual([path.relative(baseDir, filepath)]);
+    expect(fs.readdirSync(baseDir).filter(name => name.endsWith('.tmp'))).toEqual([]);
+
+    const relative = new MinimalStorage(path.relative(process.cwd(), baseDir));
+    relative.loadIndex();
+    expect([...relative.index.values()].map(entry => entry.id)).toEqual([saved.id]);
+    expect((await relative.getMemory(saved.id)).content).toBe('portable');
+  });
+});
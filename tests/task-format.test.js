@@ -0,0 +1,51 @@
+import yaml from 'js-yaml';
+import { TaskFormat } from '../lib/task-format.js';
+
+describe('TaskFormat frontmatter emitter', () => {
+  test('round-trips scalars that need quoting', () => {
+    const task = {
+      id: 'task-1',
+      title: 'Fix: the "bug" #1',
+      serial: 'TASK-00001',
+      status: 'todo',
+      priority: 'high',
+      project: 'my project',
+      tags: ['plain', 'true', '123', '- dash', ''],
+      created: '2024-01-01T00:00:00.000Z',
+      description: 'Body text'
+    };
+
+    const parsed = TaskFormat.parseTaskContent(TaskFormat.generateMarkdownContent(task));
+
+    expect(parsed.title).toBe(task.title);
+    expect(parsed.project).toBe(task.project);
+    expect(parsed.tags).toEqual(task.tags);
+    expect(parsed.created).toBe(task.created);
+    expect(parsed.description).toBe('Body text');
+  });
+
+  test('round-trips memory connections in a form js-yaml also reads', () => {
+    const task = {
+      id: 'task-2',
+      title: 'Linked task',
+      memory_connections: [{ memory_id: 'abc', relevance: 0.5, connection_type: 'research', matched_terms: ['x', 'y z'] }]
+    };
+
+    const content = TaskFormat.generateMarkdownContent(task);
+    const parsed = TaskFormat.parseTaskContent(content);
+
+    expect(parsed.memory_connections).toEqual(task.memory_connections);
+    expect(yaml.load(content.match(TaskFormat.FRONTMATTER_REGEX)[1], TaskFormat.YAML_LOAD_OPTIONS).memory_connections)
+      .toEqual(task.memory_connections);
+    expect(parsed.manual_memories).toEqual([]);
+  });
+
+  test('flat frontmatter parser agrees with js-yaml or defers to it', () => {
+    const flat = "id: task-3\ntitle: \"a: b\"\ncount: 12\ndone: false\ncreated: '2024-01-01'\ntags:\n  - x\n  - \"y z\"\nempty: []";
+    expect(TaskFormat.parseFlatYaml(flat)).toEqual(yaml.load(flat, TaskFormat.YAML_LOAD_OPTIONS));
+
+    expect(TaskFormat.parseFlatYaml('memory_connections:\n  - memory_id: abc')).toBeUndefined();
+    expect(TaskFormat.parseFlatYaml('id: a # comment')).toBeUndefined();
+    expect(TaskFormat.parseFlatYaml('id: a\nid: b')).toBeUndefined();
+  });
+});
@@ -0,0 +1,37 @@
+import { withArgumentValidation } from '../lib/tool-argument-validator.js';
+
+const tools = [
+  {
+    name: 'search_memories',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: { type: 'string' },
+        limit: { type: 'number' }
+      },
+      required: ['query']
+    }
+  }
+];
+
+describe('withArgumentValidation', () => {
+  test('rejects bad arguments without calling the handler', () => {
+    const calls = [];
+    const handlers = withArgumentValidation(tools, new Map([['search_memories', args => calls.push(args)]]));
+    const search = handlers.get('search_memories');
+
+    expect(() => search({ query: 'x', limit: 'abc' })).toThrow('Invalid arguments for search_memories');
+    expect(() => search({ limit: 5 })).toThrow('Invalid arguments for search_memories');
+    expect(calls).toHaveLength(0);
+  });
+
+  test('passes valid arguments to the handler unchanged', async () => {
+    const handlers = withArgumentValidation(tools, new Map([['search_memories', async args => ({ received: args })]]));
+    const args = { query: 'needle', limit: 3 };
+
+    const result = await handlers.get('search_memories')(args);
+
+    expect(result.received).toBe(args);
+    expect(args).toEqual({ query: 'needle', limit: 3 });
+  });
+});
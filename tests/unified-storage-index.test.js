@@ -0,0 +1,134 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { UnifiedMemoryStorage } from '../lib/unified-storage-adapter.js';
+
+// Point the storage at a throwaway directory instead of the user's data dir
+function createStorage(rootDir) {
+  const storage = new UnifiedMemoryStorage(path.join(rootDir, 'legacy'));
+  storage.unifiedStorage.unifiedPath = rootDir;
+  storage.unifiedStorage.config.enableMigration = false;
+  storage.unifiedStorage.config.createBackups = false;
+  return storage;
+}
+
+describe('UnifiedMemoryStorage in-memory index', () => {
+  let rootDir;
+  let storage;
+
+  beforeEach(() => {
+    rootDir = fs.mkdtempSync(path.join(os.tmpdir(), 'lis-index-'));
+    storage = createStorage(rootDir);
+  });
+
+  afterEach(() => {
+    fs.rmSync(rootDir, { recursive: true, force: true });
+  });
+
+  test('saved memories are served from the index', async () => {
+    const first = await storage.addMemory('hello world', 'alpha', 'code', ['x']);
+    const second = await storage.addMemory('second entry', 'beta');
+
+    expect((await storage.listMemories()).map(m => m.id).sort())
+      .toEqual([first.id, second.id].sort());
+    expect((await storage.getMemory(first.id)).content).toBe('hello world');
+    expect(await storage.listMemories({ project: 'beta' })).toHaveLength(1);
+  });
+
+  test('saved memories read back the same as after a restart', async () => {
+    const saved = await storage.addMemory('  padded content\n\n', 'alpha', 'code', ['x']);
+    const cached = await storage.getMemory(saved.id);
+
+    expect(cached.content).toBe('padded content');
+    expect(cached).toEqual(await createStorage(rootDir).getMemory(saved.id));
+  });
+
+  test('changes to returned memories do not leak into the index', async () => {
+    const saved = await storage.addMemory('original', 'alpha', 'code', ['x']);
+
+    const fetched = await storage.getMemory(saved.id);
+    fetched.content = 'changed';
+    fetched.tags.push('y');
+    fetched.task_connections = [{ task_id: 't1' }];
+    (await storage.listMemories())[0].tags.push('z');
+
+    const again = await storage.getMemory(saved.id);
+    expect(again.content).toBe('original');
+    expect(again.tags).toEqual(['x']);
+    expect(again.task_connections).toBeUndefined();
+    expect((await storage.searchMemories('original'))[0].tags).toEqual(['x']);
+  });
+
+  test('a file that vanishes between listing and stat is skipped', async () => {
+    const kept = await storage.addMemory('still here', 'alpha');
+    // A dangling symlink is listed by readdir but fails stat with ENOENT
+    fs.symlinkSync(path.join(rootDir, 'gone.md'), path.join(rootDir, 'memories', 'alpha', 'gone.md'));
+
+    expect((await storage.listMemories()).map(m => m.id)).toEqual([kept.id]);
+  });
+
+  test('a broken project symlink is skipped', async () => {
+    const kept = await storage.addMemory('still listed', 'alpha');
+    fs.symlinkSync(path.join(rootDir, 'missing-dir'), path.join(rootDir, 'memories', 'dead-link'));
+
+    expect((await storage.listMemories()).map(m => m.id)).toEqual([kept.id]);
+  });
+
+  test('files changed on disk are re-parsed on the next read', async () => {
+    const saved = await storage.addMemory('before edit', 'alpha');
+    await storage.listMemories();
+
+    const original = fs.readFileSync(saved.filepath, 'utf8');
+    fs.writeFileSync(saved.filepath, original.replace('before edit', 'after edit'));
+    const later = new Date(Date.now() + 5000);
+    fs.utimesSync(saved.filepath, later, later);
+
+    expect((await storage.getMemory(saved.id)).content).toBe('after edit');
+  });
+
+  test('deleted files drop out of the index', async () => {
+    const kept = await storage.addMemory('keep me', 'alpha');
+    const removed = await storage.addMemory('remove me', 'alpha');
+
+    expect(await storage.deleteMemory(removed.id)).toBe(true);
+    expect(await storage.getMemory(removed.id)).toBeUndefined();
+
+    fs.unlinkSync(kept.filepath);
+    expect(await storage.listMemories()).toHaveLength(0);
+  });
+
+  test('memories are listed newest first', async () => {
+    const projectDir = path.join(rootDir, 'memories', 'alpha');
+    fs.mkdirSync(projectDir, { recursive: true });
+    const stamps = { old: '2023-01-01T00:00:00.000Z', new: '2024-06-01T00:00:00.000Z', mid: '2023-09-01T00:00:00.000Z' };
+    for (const [id, timestamp] of Object.entries(stamps)) {
+      const content = storage.generateMarkdownContent({ id, timestamp, complexity: '1', category: 'code', project: 'alpha', content: id });
+      fs.writeFileSync(path.join(projectDir, `${id}.md`), content);
+    }
+
+    expect((await storage.listMemories()).map(m => m.id)).toEqual(['new', 'mid', 'old']);
+    expect((await storage.listMemories({ limit: 2 })).map(m => m.id)).toEqual(['new', 'mid']);
+    expect((await storage.searchMemories('m', { limit: 1 })).map(m => m.id)).toEqual(['mid']);
+    expect((await storage.searchMemories('EW')).map(m => m.id)).toEqual(['new']);
+  });
+
+  test('search results match with and without the full-text index', async () => {
+    await storage.addMemory('Straße café ÜBER naïve', 'alpha', 'code', ['Résumé']);
+    await storage.addMemory('KELVIN \u212A scale İstanbul', 'alpha', 'code', ['ünits']);
+    await storage.addMemory('plain ascii text', 'beta', 'code', ['Tag one', 'tag two']);
+
+    // A second instance over the same directory that always scans
+    const scanning = createStorage(rootDir);
+    await scanning.initialize();
+    scanning.searchDb = null;
+
+    const queries = ['ab', 'É', 'é', 'straße', 'STRASSE', 'café', 'über', 'NAÏ', 'ünits',
+      'kelvin', '\u212A', 'istanbul', 'i\u0307st', 'RÉSUMÉ', 'asc', 'ASCII TEXT', 'tag', 'g t', '"quoted"'];
+    for (const query of queries) {
+      const indexed = (await storage.searchMemories(query)).map(m => m.id);
+      const scanned = (await scanning.searchMemories(query)).map(m => m.id);
+      expect([query, indexed]).toEqual([query, scanned]);
+    }
+    expect(await storage.searchMemories('naï')).toHaveLength(1);
+  });
+});
@@ -0,0 +1,82 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { UnifiedTaskStorage } from '../lib/unified-storage-adapter.js';
+
+// Point the storage at a throwaway directory instead of the user's data dir
+function createStorage(rootDir) {
+  const storage = new UnifiedTaskStorage(path.join(rootDir, 'legacy'));
+  storage.unifiedStorage.unifiedPath = rootDir;
+  storage.unifiedStorage.config.enableMigration = false;
+  storage.unifiedStorage.config.createBackups = false;
+  return storage;
+}
+
+function readTaskFile(rootDir, project) {
+  return JSON.parse(fs.readFileSync(path.join(rootDir, 'tasks', project, 'tasks.json'), 'utf8'));
+}
+
+function writeTaskFile(rootDir, project, tasks) {
+  const dir = path.join(rootDir, 'tasks', project);
+  fs.mkdirSync(dir, { recursive: true });
+  fs.writeFileSync(path.join(dir, 'tasks.json'), JSON.stringify(tasks, null, 2));
+}
+
+describe('UnifiedTaskStorage task lookup cache', () => {
+  let rootDir;
+  let storage;
+  let log;
+
+  beforeEach(() => {
+    rootDir = fs.mkdtempSync(path.join(os.tmpdir(), 'lis-tasks-'));
+    storage = createStorage(rootDir);
+    log = console.log;
+    console.log = () => {};
+  });
+
+  afterEach(() => {
+    console.log = log;
+    fs.rmSync(rootDir, { recursive: true, force: true });
+  });
+
+  test('locates a task after its file moved it to another project', async () => {
+    const task = await storage.createTask({ title: 'Move me', project: 'alpha' });
+    await storage.listTasks();
+
+    // Move the task between project files behind the storage's back
+    const [moved] = readTaskFile(rootDir, 'alpha');
+    writeTaskFile(rootDir, 'alpha', []);
+    writeTaskFile(rootDir, 'beta', [{ ...moved, project: 'beta' }]);
+
+    const result = await storage.updateTask(task.id, { status: 'done' });
+
+    expect(result.success).toBe(true);
+    expect(result.task.status).toBe('done');
+    expect(readTaskFile(rootDir, 'beta')[0].status).toBe('done');
+    expect(readTaskFile(rootDir, 'alpha')).toEqual([]);
+  });
+
+  test('deleted tasks no longer show up when listing', async () => {
+    const kept = await storage.createTask({ title: 'Keep', project: 'alpha' });
+    const removed = await storage.createTask({ title: 'Remove', project: 'alpha' });
+    await storage.listTasks();
+
+    const result = await storage.deleteTask(removed.id);
+
+    expect(result.success).toBe(true);
+    expect((await storage.listTasks()).map(t => t.id)).toEqual([kept.id]);
+    expect((await storage.deleteTask(removed.id)).success).toBe(false);
+  });
+
+  test('task files edited outside the cache are re-read', async () => {
+    await storage.createTask({ title: 'Original', project: 'alpha' });
+    expect((await storage.listTasks()).map(t => t.title)).toEqual(['Original']);
+
+    const tasks = readTaskFile(rootDir, 'alpha');
+    tasks[0].title = 'Edited elsewhere';
+    writeTaskFile(rootDir, 'alpha', tasks);
+
+    expect((await storage.listTasks()).map(t => t.title)).toEqual(['Edited elsewhere']);
+    expect((await storage.listTasks({ project: 'alpha' })).map(t => t.title)).toEqual(['Edited elsewhere']);
+  });
+});